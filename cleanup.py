@@ -6,7 +6,8 @@ This script helps clean up temporary debug files created by the Windy Notifier a
 """
 
 import os
-import glob
+import re
+import fnmatch
 import argparse
 
 # Patterns for temp/debug files
@@ -17,22 +18,34 @@ TEMP_FILE_PATTERNS = [
     "last_check.json"
 ]
 
+# All patterns combined into a single regex, compiled once
+_TEMP_FILE_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in TEMP_FILE_PATTERNS))
+
 def list_files_to_clean():
     """
     List all temporary files that can be safely deleted.
     
+    The current directory is scanned once and each entry is matched against
+    all of TEMP_FILE_PATTERNS with a single regex. As with glob, hidden
+    files are never matched.
+    
     Returns:
-        list: Paths of files that can be safely deleted
+        list: os.DirEntry objects of files that can be safely deleted, sorted by name
     """
-    all_files = []
-    for pattern in TEMP_FILE_PATTERNS:
-        all_files.extend(glob.glob(pattern))
-    
     # Filter out important files
-    important_files = ["README.md", ".env", ".env.example"]
-    temp_files = [f for f in all_files if f not in important_files]
+    important_files = {"README.md", ".env", ".env.example"}
     
-    return sorted(temp_files)
+    with os.scandir('.') as entries:
+        temp_files = sorted(
+            (e for e in entries
+             if not e.name.startswith('.')
+             and e.is_file()
+             and _TEMP_FILE_RE.fullmatch(e.name)
+             and e.name not in important_files),
+            key=lambda e: e.name
+        )
+    
+    return temp_files
 
 def main():
     """Main function to list and optionally delete temporary files."""
@@ -47,16 +60,20 @@ def main():
         return
     
     print("The following temporary files will be deleted:")
-    for file in files_to_clean:
-        print(f"  - {file}")
+    for entry in files_to_clean:
+        print(f"  - {entry.name}")
     
     if args.delete or input("\nDelete these files? (y/n): ").lower() == 'y':
-        for file in files_to_clean:
+        errors = []
+        for entry in files_to_clean:
             try:
-                os.remove(file)
-                print(f"Deleted: {file}")
-            except Exception as e:
-                print(f"Error deleting {file}: {e}")
+                os.unlink(entry.path)
+                print(f"Deleted: {entry.name}")
+            except OSError as e:
+                errors.append((entry.name, e))
+        
+        for name, e in errors:
+            print(f"Error deleting {name}: {e}")
         
         print("\nCleanup completed.")
     else:
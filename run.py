@@ -11,10 +11,9 @@ Run this script to start the application.
 import sys
 import os
 import logging
-from pathlib import Path
 
-# Create debug directory if it doesn't exist
-Path("debug").mkdir(exist_ok=True)
+# Create the debug directory and load .env before logging to debug/
+import windy_notifier._bootstrap  # noqa: F401
 
 # Configure basic logging for the startup process
 logging.basicConfig(
@@ -8,16 +8,19 @@ in the Windy Notifier project. It can run all tests or specific ones.
 
 import os
 import sys
+import shlex
 import argparse
 import subprocess
-from pathlib import Path
+
+import windy_notifier._bootstrap  # noqa: F401 - creates debug/ and loads .env
 
 # Define test modules
 TEST_MODULES = {
-    "scraper": "windy_notifier/tests/test_scraper.py",
-    "email": "windy_notifier/tests/test_notifiers.py --method email",
-    "telegram": "windy_notifier/tests/test_notifiers.py --method telegram",
-    "notifiers": "windy_notifier/tests/test_notifiers.py --method both"
+    "scraper": ["windy_notifier.tests.test_scraper"],
+    "converters": ["windy_notifier.tests.test_converters"],
+    "email": ["windy_notifier.tests.test_notifiers", "--method", "email"],
+    "telegram": ["windy_notifier.tests.test_notifiers", "--method", "telegram"],
+    "notifiers": ["windy_notifier.tests.test_notifiers", "--method", "both"]
 }
 
 
@@ -36,14 +39,13 @@ def run_test(test_name, extra_args=None):
         print(f"❌ Unknown test: {test_name}")
         return 1
     
-    command = f"python {TEST_MODULES[test_name]}"
-    if extra_args:
-        command += f" {' '.join(extra_args)}"
+    command = [sys.executable, "-m", *TEST_MODULES[test_name]]
+    command.extend(extra_args or [])
     
     print(f"\n==== Running {test_name} tests ====")
-    print(f"Command: {command}\n")
+    print(f"Command: {' '.join(shlex.quote(arg) for arg in command)}\n")
     
-    result = subprocess.run(command, shell=True)
+    result = subprocess.run(command, shell=False)
     return result.returncode
 
 
@@ -57,9 +59,6 @@ def main():
     
     args = parser.parse_args()
     
-    # Create debug directory if it doesn't exist
-    Path("debug").mkdir(exist_ok=True)
-    
     exit_code = 0
     if 'all' in args.tests:
         print("==== Running all tests ====")
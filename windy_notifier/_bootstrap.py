@@ -0,0 +1,17 @@
+"""
+Bootstrap Module
+
+Process-wide setup shared by the entry points: creates the debug directory
+and loads environment variables from the .env file. Importing this module
+runs the setup exactly once per process.
+"""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Create debug directory if it doesn't exist
+Path("debug").mkdir(exist_ok=True)
+
+# Load environment variables
+load_dotenv()
@@ -10,34 +10,50 @@ the wind exceeds a specified threshold.
 import os
 import time
 import json
+import queue
+import atexit
 import logging
+import concurrent.futures
+import logging.handlers
 import traceback
-from pathlib import Path
 from datetime import datetime
 
-import schedule
-from dotenv import load_dotenv
-
-from windy_notifier.scraper.weatherlink import get_weather_data
-from windy_notifier.utils.converters import parse_wind_data, convert_to_knots, get_wind_description
-from windy_notifier.notifiers.email_notifier import send_email_notification
-from windy_notifier.notifiers.telegram_notifier import send_telegram_notification
-
-# Load environment variables
-load_dotenv()
-
-# Create debug directory if it doesn't exist
-Path("debug").mkdir(exist_ok=True)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("debug/windy_notifier.log"),
-        logging.StreamHandler()
-    ]
-)
+import windy_notifier._bootstrap  # noqa: F401 - creates debug/ and loads .env
+
+# Configure logging. Records are queued and written by a background listener
+# so that checks never block on log file I/O. Handlers already installed on
+# the root logger (e.g. by run.py) are moved behind the listener; without any,
+# the application log file and the console are used, like basicConfig.
+# This runs before the modules below are imported: atexit calls hooks in
+# reverse order, so the listener then stops after their exit hooks (closing
+# the browser and SMTP sessions) have logged.
+_root_logger = logging.getLogger()
+if not any(isinstance(h, logging.handlers.QueueHandler) for h in _root_logger.handlers):
+    _log_handlers = list(_root_logger.handlers)
+    if not _log_handlers:
+        _log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        _log_handlers = [
+            logging.FileHandler("debug/windy_notifier.log"),
+            logging.StreamHandler()
+        ]
+        for _handler in _log_handlers:
+            _handler.setFormatter(_log_formatter)
+        _root_logger.setLevel(logging.INFO)
+    for _handler in _log_handlers:
+        _root_logger.removeHandler(_handler)
+    
+    _log_queue = queue.SimpleQueue()
+    _root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    
+    _log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+from windy_notifier.scraper.weatherlink import get_weather_data  # noqa: E402
+from windy_notifier.utils.converters import parse_wind_data, convert_to_knots, get_wind_description  # noqa: E402
+from windy_notifier.notifiers.email_notifier import send_email_notification  # noqa: E402
+from windy_notifier.notifiers.telegram_notifier import send_telegram_notification  # noqa: E402
+
 logger = logging.getLogger("windy_notifier")
 
 # Constants
@@ -45,6 +61,11 @@ WIND_THRESHOLD = int(os.getenv("WIND_THRESHOLD", "15"))  # Wind speed threshold
 CHECK_INTERVAL_MINUTES = int(os.getenv("CHECK_INTERVAL_MINUTES", "30"))  # How often to check
 NOTIFICATION_METHOD = os.getenv("NOTIFICATION_METHOD", "email").lower()  # email, telegram, or both
 
+# Last check file, written atomically through a temporary file
+LAST_CHECK_FILE = "debug/last_check.json"
+_LAST_CHECK_TMP = "debug/.last_check.json.tmp"
+_ENCODER = json.JSONEncoder(indent=2, separators=(',', ': ')).encode
+
 
 def get_wind_data():
     """
@@ -84,6 +105,40 @@ def get_wind_data():
         return None, None
 
 
+# Resolve the email backend once: prefer the simple SMTP notifier and fall
+# back to the standard email notifier if it is not available
+try:
+    from windy_notifier.notifiers.simple_smtp_notifier import send_simple_smtp_notification as _send_email
+except ImportError:
+    _send_email = send_email_notification
+
+
+def _send_both(wind_speed, wind_gust, threshold):
+    """Send with email and Telegram concurrently, succeeding if either one does."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            "email": executor.submit(_send_email, wind_speed, wind_gust, threshold),
+            "Telegram": executor.submit(send_telegram_notification, wind_speed, wind_gust, threshold)
+        }
+    
+    notification_sent = False
+    for method, future in futures.items():
+        try:
+            notification_sent = future.result() or notification_sent
+        except Exception as e:
+            logger.error(f"Error sending {method} notification: {e}")
+    return notification_sent
+
+
+# Notification function for each method, resolved once from NOTIFICATION_METHOD
+_NOTIFIERS = {
+    "email": _send_email,
+    "telegram": send_telegram_notification,
+    "both": _send_both
+}
+_NOTIFY_FN = _NOTIFIERS.get(NOTIFICATION_METHOD, _NOTIFIERS["email"])
+
+
 def send_notification(wind_speed, wind_gust=None):
     """
     Send a notification using the configured method(s).
@@ -95,47 +150,7 @@ def send_notification(wind_speed, wind_gust=None):
     Returns:
         bool: True if at least one notification method succeeded
     """
-    threshold = WIND_THRESHOLD
-    notification_sent = False
-    
-    if NOTIFICATION_METHOD == "telegram":
-        # Only use Telegram
-        logger.info("Using Telegram for notification")
-        notification_sent = send_telegram_notification(wind_speed, wind_gust, threshold)
-    
-    elif NOTIFICATION_METHOD == "email":
-        # Use the simple SMTP notifier
-        try:
-            # Import simple SMTP notifier
-            from windy_notifier.notifiers.simple_smtp_notifier import send_simple_smtp_notification
-            logger.info("Using simple SMTP notification")
-            notification_sent = send_simple_smtp_notification(wind_speed, wind_gust, threshold)
-        except ImportError:
-            # Fall back to regular email if simple SMTP is not available
-            logger.info("Simple SMTP notifier not available, using standard email notification")
-            notification_sent = send_email_notification(wind_speed, wind_gust, threshold)
-    
-    elif NOTIFICATION_METHOD == "both":
-        # Try both methods
-        logger.info("Using both email and Telegram for notification")
-        
-        # Try simple SMTP first
-        try:
-            from windy_notifier.notifiers.simple_smtp_notifier import send_simple_smtp_notification
-            email_success = send_simple_smtp_notification(wind_speed, wind_gust, threshold)
-        except ImportError:
-            # Fall back to regular email
-            email_success = send_email_notification(wind_speed, wind_gust, threshold)
-            
-        telegram_success = send_telegram_notification(wind_speed, wind_gust, threshold)
-        notification_sent = email_success or telegram_success
-    
-    else:
-        # Default to email
-        logger.warning(f"Unknown notification method: {NOTIFICATION_METHOD}, defaulting to email")
-        notification_sent = send_email_notification(wind_speed, wind_gust, threshold)
-    
-    return notification_sent
+    return _NOTIFY_FN(wind_speed, wind_gust, WIND_THRESHOLD)
 
 
 def check_wind():
@@ -156,7 +171,7 @@ def check_wind():
                 logger.info(f"Wind speed ({wind_speed:.1f} knots) is below threshold ({WIND_THRESHOLD} knots)")
                 
             # Save the last check result
-            save_last_check(wind_speed, wind_gust)
+            save_last_check(wind_speed, wind_gust, wind_desc, beaufort_num)
         else:
             logger.warning("Could not determine wind speed during this check")
             
@@ -165,16 +180,19 @@ def check_wind():
         logger.error(traceback.format_exc())
 
 
-def save_last_check(wind_speed, wind_gust=None):
+def save_last_check(wind_speed, wind_gust=None, wind_desc=None, beaufort_num=None):
     """
     Save the result of the last check to a file.
     
     Args:
         wind_speed (float): The wind speed in knots
         wind_gust (float, optional): The wind gust speed in knots
+        wind_desc (str, optional): Wind description, computed if not provided
+        beaufort_num (int, optional): Beaufort number, computed if not provided
     """
     try:
-        beaufort_num, wind_desc = get_wind_description(wind_speed)
+        if wind_desc is None:
+            beaufort_num, wind_desc = get_wind_description(wind_speed)
         
         data = {
             "timestamp": time.time(),
@@ -187,8 +205,10 @@ def save_last_check(wind_speed, wind_gust=None):
             "above_threshold": wind_speed >= WIND_THRESHOLD
         }
         
-        with open("debug/last_check.json", "w") as f:
-            json.dump(data, f, indent=2)
+        payload = _ENCODER(data).encode('utf-8')
+        with open(_LAST_CHECK_TMP, "wb") as f:
+            f.write(payload)
+        os.replace(_LAST_CHECK_TMP, LAST_CHECK_FILE)
             
         logger.debug("Saved last check data")
     except Exception as e:
@@ -200,17 +220,21 @@ def run():
     logger.info("Starting Windy Notifier")
     logger.info(f"Will check for winds exceeding {WIND_THRESHOLD} knots every {CHECK_INTERVAL_MINUTES} minutes")
     logger.info(f"Notification method: {NOTIFICATION_METHOD}")
+    if NOTIFICATION_METHOD not in _NOTIFIERS:
+        logger.warning(f"Unknown notification method: {NOTIFICATION_METHOD}, defaulting to email")
     
-    # Run once at startup
-    check_wind()
-    
-    # Schedule regular checks
-    schedule.every(CHECK_INTERVAL_MINUTES).minutes.do(check_wind)
+    # Check once at startup, then every CHECK_INTERVAL_MINUTES, sleeping
+    # until each check is due
+    interval = CHECK_INTERVAL_MINUTES * 60
+    next_check = time.monotonic()
     
     try:
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            now = time.monotonic()
+            if now >= next_check:
+                check_wind()
+                next_check = now + interval
+            time.sleep(max(0.0, next_check - time.monotonic()))
     except KeyboardInterrupt:
         logger.info("Windy Notifier stopped by user")
     except Exception as e:
@@ -7,8 +7,13 @@ supporting both plain text and HTML formatting.
 """
 
 import os
+import re
+import atexit
 import smtplib
 import logging
+import functools
+from types import SimpleNamespace
+from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from ..utils.converters import get_wind_description, format_wind_speed
@@ -16,6 +21,154 @@ from ..utils.converters import get_wind_description, format_wind_speed
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Same layout as the output of date(1)
+_TIMESTAMP_FORMAT = '%a %b %d %H:%M:%S %Z %Y'
+
+# Email subject, filled in with the formatted wind speed
+_SUBJECT_FMT = "High Wind Alert: %s"
+
+# Message templates, filled in with str.format by the create_*_message methods
+_HTML_TEMPLATE = """
+<html>
+<head>
+    <style>
+        body {{
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }}
+        .container {{
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+        }}
+        h1 {{
+            color: #e74c3c;
+            border-bottom: 1px solid #eee;
+            padding-bottom: 10px;
+        }}
+        .data-row {{
+            display: flex;
+            margin-bottom: 10px;
+        }}
+        .label {{
+            font-weight: bold;
+            width: 180px;
+        }}
+        .highlight {{
+            color: #e74c3c;
+            font-weight: bold;
+        }}
+        .footer {{
+            margin-top: 30px;
+            font-size: 0.8em;
+            color: #777;
+            border-top: 1px solid #eee;
+            padding-top: 10px;
+        }}
+        .button {{
+            display: inline-block;
+            background-color: #3498db;
+            color: white;
+            padding: 10px 15px;
+            text-decoration: none;
+            border-radius: 4px;
+            margin-top: 15px;
+        }}
+        .button:hover {{
+            background-color: #2980b9;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🌬️ High Wind Alert 🌬️</h1>
+        <p>High wind conditions have been detected at <strong>{location}</strong>!</p>
+
+        <div class="data-row">
+            <div class="label">Current wind speed:</div>
+            <div class="value highlight">{wind_formatted}</div>
+        </div>
+
+        <div class="data-row">
+            <div class="label">Wind conditions:</div>
+            <div class="value">{wind_desc}</div>
+        </div>
+
+        <div class="data-row">
+            <div class="label">Wind gusts:</div>
+            <div class="value">{gust_formatted}</div>
+        </div>
+
+        <div class="data-row">
+            <div class="label">Alert threshold:</div>
+            <div class="value">{threshold} knots</div>
+        </div>
+
+        <p>
+            <a href="{website_url}" class="button">View Port Website</a>
+        </p>
+
+        <div class="footer">
+            This is an automated message from Windy Notifier.<br>
+            Time: {timestamp}
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# HTML template with whitespace collapsed, about a third smaller on the wire
+_HTML_TEMPLATE_MIN = re.sub(r">\s+<", "><", re.sub(r"\s+", " ", _HTML_TEMPLATE)).strip()
+
+_TEXT_TEMPLATE = """
+🌬️ High Wind Alert 🌬️
+
+High wind conditions have been detected at {location}!
+
+Current wind speed: {wind_formatted}
+Wind conditions: {wind_desc}
+Wind gusts: {gust_formatted}
+Alert threshold: {threshold} knots
+
+Check the website for more details: {website_url}
+
+This is an automated message from Windy Notifier.
+Time: {timestamp}
+"""
+
+# Notifier built from environment variables, created on first use
+_DEFAULT_NOTIFIER = None
+
+# Separator of comma-separated settings such as RECIPIENT_EMAIL
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    Read the email settings from environment variables.
+    
+    The environment is read once, on first use rather than at import, so that
+    callers can load their .env file after importing this module.
+    
+    Returns:
+        SimpleNamespace: Email settings from the environment
+    """
+    default_recipient = os.getenv("RECIPIENT_EMAIL", "")
+    return SimpleNamespace(
+        smtp_server=os.getenv("SMTP_SERVER"),
+        smtp_port=int(os.getenv("SMTP_PORT", "587")),
+        smtp_username=os.getenv("SMTP_USERNAME"),
+        smtp_password=os.getenv("SMTP_PASSWORD"),
+        sender_email=os.getenv("SENDER_EMAIL"),
+        recipients=tuple(r for r in _CSV_SPLIT.split(default_recipient.strip()) if r),
+        website_url=os.getenv("PORT_WEBSITE_URL",
+                              "https://www.ville-saintraphael.fr/utile/la-regie-des-ports-raphaelois")
+    )
+
 
 class EmailNotifier:
     """Email notification handler for wind alerts."""
@@ -30,44 +183,92 @@ class EmailNotifier:
         self.config = config or {}
         
         # Load config from environment variables if not provided
-        self.smtp_server = self.config.get('smtp_server', os.getenv("SMTP_SERVER"))
-        self.smtp_port = int(self.config.get('smtp_port', os.getenv("SMTP_PORT", "587")))
-        self.smtp_username = self.config.get('smtp_username', os.getenv("SMTP_USERNAME"))
-        self.smtp_password = self.config.get('smtp_password', os.getenv("SMTP_PASSWORD"))
-        self.sender_email = self.config.get('sender_email', os.getenv("SENDER_EMAIL"))
+        env = _load_env()
+        self.smtp_server = self.config.get('smtp_server', env.smtp_server)
+        self.smtp_port = int(self.config.get('smtp_port', env.smtp_port))
+        self.smtp_username = self.config.get('smtp_username', env.smtp_username)
+        self.smtp_password = self.config.get('smtp_password', env.smtp_password)
+        self.sender_email = self.config.get('sender_email', env.sender_email)
         
         # Default recipient or list from environment
-        default_recipient = os.getenv("RECIPIENT_EMAIL", "")
-        self.recipients = self.config.get('recipients', 
-                                          [r.strip() for r in default_recipient.split(',')])
+        self.recipients = self.config.get('recipients', list(env.recipients))
         
         # Make sure recipients is always a list
         if isinstance(self.recipients, str):
             self.recipients = [self.recipients]
             
         # Website URL for reference in notifications
-        self.website_url = self.config.get(
-            'website_url', 
-            os.getenv("PORT_WEBSITE_URL", 
-                      "https://www.ville-saintraphael.fr/utile/la-regie-des-ports-raphaelois")
-        )
+        self.website_url = self.config.get('website_url', env.website_url)
         
         # Check if configuration is valid
-        self.is_configured = all([
-            self.smtp_server, 
-            self.smtp_username, 
-            self.smtp_password, 
-            self.sender_email, 
-            self.recipients
-        ])
+        self.is_configured = bool(
+            self.smtp_server
+            and self.smtp_username
+            and self.smtp_password
+            and self.sender_email
+            and self.recipients
+        )
+        
+        # Logged-in SMTP session, kept open between notifications until close()
+        self._smtp = None
     
     def is_valid(self):
         """Check if the email configuration is valid."""
         return self.is_configured
     
-    def create_html_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
+    def _connect(self):
         """
-        Create an HTML-formatted email message about wind conditions.
+        Open a new SMTP session, start TLS and log in.
+        
+        Returns:
+            smtplib.SMTP: The logged-in SMTP session
+        """
+        logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}...")
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            logger.info("Connected to SMTP server, starting TLS...")
+            server.starttls()
+            logger.info(f"TLS started, attempting to login with username: {self.smtp_username}...")
+            server.login(self.smtp_username, self.smtp_password)
+            logger.info("Login successful!")
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        return server
+    
+    def _get_connection(self):
+        """
+        Return the open SMTP session if it is still alive, reconnecting otherwise.
+        
+        Returns:
+            smtplib.SMTP: A logged-in SMTP session
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP session is no longer usable, reconnecting...")
+            self.close()
+        return self._connect()
+    
+    def close(self):
+        """Close the SMTP session if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        finally:
+            self._smtp = None
+    
+    def _build_context(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
+        """
+        Compute the values shared by the text and HTML messages.
         
         Args:
             wind_speed (float): Current wind speed in knots
@@ -76,108 +277,50 @@ class EmailNotifier:
             location (str): Name of the location being monitored
             
         Returns:
-            str: HTML-formatted message
+            dict: Template fields for _render
         """
         # Get wind description
         _, wind_desc = get_wind_description(wind_speed)
         
-        # Format wind speeds
-        wind_formatted = format_wind_speed(wind_speed)
-        gust_formatted = format_wind_speed(wind_gust) if wind_gust else "N/A"
+        return {
+            "location": location,
+            "wind_formatted": format_wind_speed(wind_speed),
+            "wind_desc": wind_desc,
+            "gust_formatted": format_wind_speed(wind_gust) if wind_gust else "N/A",
+            "threshold": threshold,
+            "website_url": self.website_url,
+            "timestamp": datetime.now().astimezone().strftime(_TIMESTAMP_FORMAT)
+        }
+    
+    def _render(self, ctx, html):
+        """
+        Render a message from a context built by _build_context.
         
-        # HTML message with styled content
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                }}
-                .container {{
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                }}
-                h1 {{
-                    color: #e74c3c;
-                    border-bottom: 1px solid #eee;
-                    padding-bottom: 10px;
-                }}
-                .data-row {{
-                    display: flex;
-                    margin-bottom: 10px;
-                }}
-                .label {{
-                    font-weight: bold;
-                    width: 180px;
-                }}
-                .highlight {{
-                    color: #e74c3c;
-                    font-weight: bold;
-                }}
-                .footer {{
-                    margin-top: 30px;
-                    font-size: 0.8em;
-                    color: #777;
-                    border-top: 1px solid #eee;
-                    padding-top: 10px;
-                }}
-                .button {{
-                    display: inline-block;
-                    background-color: #3498db;
-                    color: white;
-                    padding: 10px 15px;
-                    text-decoration: none;
-                    border-radius: 4px;
-                    margin-top: 15px;
-                }}
-                .button:hover {{
-                    background-color: #2980b9;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🌬️ High Wind Alert 🌬️</h1>
-                <p>High wind conditions have been detected at <strong>{location}</strong>!</p>
-                
-                <div class="data-row">
-                    <div class="label">Current wind speed:</div>
-                    <div class="value highlight">{wind_formatted}</div>
-                </div>
-                
-                <div class="data-row">
-                    <div class="label">Wind conditions:</div>
-                    <div class="value">{wind_desc}</div>
-                </div>
-                
-                <div class="data-row">
-                    <div class="label">Wind gusts:</div>
-                    <div class="value">{gust_formatted}</div>
-                </div>
-                
-                <div class="data-row">
-                    <div class="label">Alert threshold:</div>
-                    <div class="value">{threshold} knots</div>
-                </div>
-                
-                <p>
-                    <a href="{self.website_url}" class="button">View Port Website</a>
-                </p>
-                
-                <div class="footer">
-                    This is an automated message from Windy Notifier.<br>
-                    Time: {os.popen('date').read().strip()}
-                </div>
-            </div>
-        </body>
-        </html>
+        Args:
+            ctx (dict): Template fields
+            html (bool): Whether to render the HTML or the plain text message
+            
+        Returns:
+            str: Rendered message
         """
-        return html
+        template = _HTML_TEMPLATE_MIN if html else _TEXT_TEMPLATE
+        return template.format_map(ctx)
+    
+    def create_html_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
+        """
+        Create an HTML-formatted email message about wind conditions.
+        
+        Args:
+            wind_speed (float): Current wind speed in knots
+            wind_gust (float, optional): Wind gust speed in knots
+            threshold (int): Wind speed threshold that triggered the notification
+            location (str): Name of the location being monitored
+            
+        Returns:
+            str: HTML-formatted message
+        """
+        ctx = self._build_context(wind_speed, wind_gust, threshold, location)
+        return self._render(ctx, html=True)
     
     def create_text_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
         """
@@ -192,29 +335,8 @@ class EmailNotifier:
         Returns:
             str: Plain text message
         """
-        # Get wind description
-        _, wind_desc = get_wind_description(wind_speed)
-        
-        # Format wind speeds
-        wind_formatted = format_wind_speed(wind_speed)
-        gust_formatted = format_wind_speed(wind_gust) if wind_gust else "N/A"
-        
-        text = f"""
-        🌬️ High Wind Alert 🌬️
-        
-        High wind conditions have been detected at {location}!
-        
-        Current wind speed: {wind_formatted}
-        Wind conditions: {wind_desc}
-        Wind gusts: {gust_formatted}
-        Alert threshold: {threshold} knots
-        
-        Check the website for more details: {self.website_url}
-        
-        This is an automated message from Windy Notifier.
-        Time: {os.popen('date').read().strip()}
-        """
-        return text
+        ctx = self._build_context(wind_speed, wind_gust, threshold, location)
+        return self._render(ctx, html=False)
     
     def send_notification(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port", html=True):
         """
@@ -240,55 +362,56 @@ class EmailNotifier:
             logger.error(f"Recipients: {', '.join(self.recipients) if self.recipients else '✗ Missing'}")
             return False
         
-        subject = f"High Wind Alert: {format_wind_speed(wind_speed)}"
-        
-        # Create a multipart message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = self.sender_email
-        
-        # Always add a plain text version
-        text_content = self.create_text_message(wind_speed, wind_gust, threshold, location)
-        message.attach(MIMEText(text_content, "plain"))
-        
-        # Add HTML version if requested
-        if html:
-            html_content = self.create_html_message(wind_speed, wind_gust, threshold, location)
-            message.attach(MIMEText(html_content, "html"))
-        
         success = True
         try:
-            logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}...")
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                logger.info("Connected to SMTP server, starting TLS...")
-                server.starttls()
-                logger.info(f"TLS started, attempting to login with username: {self.smtp_username}...")
-                server.login(self.smtp_username, self.smtp_password)
-                logger.info("Login successful!")
-                
-                # Send to all recipients
-                for recipient in self.recipients:
-                    try:
-                        logger.info(f"Sending email to {recipient}...")
-                        message["To"] = recipient
-                        server.sendmail(self.sender_email, recipient, message.as_string())
-                        logger.info(f"Email notification sent to {recipient}")
-                    except Exception as e:
-                        logger.error(f"Failed to send email notification to {recipient}: {e}")
-                        success = False
+            # Log in first so no message is built when the server cannot be reached
+            server = self._get_connection()
+            
+            # Shared by the subject and both message versions
+            ctx = self._build_context(wind_speed, wind_gust, threshold, location)
+            subject = _SUBJECT_FMT % ctx["wind_formatted"]
+            
+            # Create a multipart message
+            message = MIMEMultipart("alternative")
+            message["Subject"] = subject
+            message["From"] = self.sender_email
+            
+            # Always add a plain text version
+            text_content = self._render(ctx, html=False)
+            message.attach(MIMEText(text_content, "plain"))
+            
+            # Add HTML version if requested
+            if html:
+                html_content = self._render(ctx, html=True)
+                message.attach(MIMEText(html_content, "html"))
+            
+            # Serialize once and deliver to everyone in a single SMTP transaction
+            message["To"] = ", ".join(self.recipients)
+            payload = message.as_string()
+            
+            # Send to all recipients
+            logger.info(f"Sending email to {', '.join(self.recipients)}...")
+            refused = server.sendmail(self.sender_email, self.recipients, payload)
+            for recipient in self.recipients:
+                if recipient in refused:
+                    logger.error(f"Failed to send email notification to {recipient}: {refused[recipient]}")
+                    success = False
+                else:
+                    logger.info(f"Email notification sent to {recipient}")
             
             return success
         
         except Exception as e:
             logger.error(f"Failed to send email notifications: {e}")
-            if "authentication" in str(e).lower():
+            self.close()
+            if isinstance(e, smtplib.SMTPAuthenticationError):
                 logger.error("This appears to be an authentication issue. Please check your SMTP username and password.")
                 logger.error("For Gmail, make sure you're using an App Password if 2FA is enabled.")
                 logger.error("For ProtonMail, ensure you're using the Bridge password and Bridge is running.")
             return False
 
 
-def send_email_notification(wind_speed, wind_gust=None, threshold=15, config=None):
+def send_email_notification(wind_speed, wind_gust=None, threshold=15, config=None, html=True):
     """
     Convenience function to send an email notification.
     
@@ -297,14 +420,37 @@ def send_email_notification(wind_speed, wind_gust=None, threshold=15, config=Non
         wind_gust (float, optional): Wind gust speed in knots
         threshold (int): Threshold that triggered the notification
         config (dict, optional): Email configuration
+        html (bool): Whether to include the HTML version of the message
         
     Returns:
         bool: Success status
     """
+    global _DEFAULT_NOTIFIER
+    if config is None:
+        if _DEFAULT_NOTIFIER is None:
+            _DEFAULT_NOTIFIER = EmailNotifier()
+        notifier = _DEFAULT_NOTIFIER
+        if notifier.is_valid():
+            return notifier.send_notification(wind_speed, wind_gust, threshold, html=html)
+        return False
+    
+    # Built for this call only, so its SMTP session is not kept open
     notifier = EmailNotifier(config)
-    if notifier.is_valid():
-        return notifier.send_notification(wind_speed, wind_gust, threshold)
-    return False
+    try:
+        if notifier.is_valid():
+            return notifier.send_notification(wind_speed, wind_gust, threshold, html=html)
+        return False
+    finally:
+        notifier.close()
+
+
+def _close_default_notifier():
+    """Close the SMTP session of the notifier shared between calls, at exit."""
+    if _DEFAULT_NOTIFIER is not None:
+        _DEFAULT_NOTIFIER.close()
+
+
+atexit.register(_close_default_notifier)
 
 
 # Simple test function for this module
@@ -7,18 +7,130 @@ the standard smtplib library without any third-party dependencies.
 """
 
 import os
+import re
+import ssl
+import atexit
+import string
 import smtplib
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from dotenv import load_dotenv
+import functools
+import concurrent.futures
+from types import SimpleNamespace
+from email.message import EmailMessage
+from email.utils import formatdate
 from ..utils.converters import get_wind_description, format_wind_speed
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# Notifier built from environment variables, reused across notifications so
+# its SMTP session stays open
+_shared_notifier = None
+
+# Recipient lists longer than this are split across parallel SMTP sessions,
+# at most _MAX_SMTP_SESSIONS at a time
+_PARALLEL_RECIPIENTS = 20
+_MAX_SMTP_SESSIONS = 4
+
+# Email subject, filled in with the formatted wind speed
+_SUBJECT_FMT = "High Wind Alert: %s"
+
+# Message templates, shared by every notifier instance
+_TEXT_TEMPLATE = string.Template("""
+High Wind Alert!
+
+High wind conditions have been detected at $location!
+
+Current wind speed: $wind_formatted
+Wind conditions: $wind_desc
+Wind gusts: $gust_formatted
+Alert threshold: $threshold knots
+
+Check the website for more details: $website_url
+
+This is an automated message from Windy Notifier.
+Time: $timestamp
+""")
+
+# Simple HTML message - no complex CSS that might be stripped by email clients
+_HTML_TEMPLATE = string.Template("""
+<html>
+<body>
+    <h1>High Wind Alert!</h1>
+    <p>High wind conditions have been detected at <strong>$location</strong>!</p>
+
+    <p><strong>Current wind speed:</strong> $wind_formatted</p>
+    <p><strong>Wind conditions:</strong> $wind_desc</p>
+    <p><strong>Wind gusts:</strong> $gust_formatted</p>
+    <p><strong>Alert threshold:</strong> $threshold knots</p>
+
+    <p><a href="$website_url">View Port Website</a></p>
+
+    <p style="color: #777; font-size: 0.8em;">
+        This is an automated message from Windy Notifier.<br>
+        Time: $timestamp
+    </p>
+</body>
+</html>
+""")
+
+# Separator of comma-separated settings such as RECIPIENT_EMAIL
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    Load the .env file and read the email settings from environment variables.
+    
+    This runs once, on first use rather than at import.
+    
+    Returns:
+        SimpleNamespace: Email settings from the environment
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    default_recipient = os.getenv("RECIPIENT_EMAIL", "")
+    return SimpleNamespace(
+        smtp_server=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+        smtp_port=int(os.getenv("SMTP_PORT", "587")),
+        smtp_username=os.getenv("SMTP_USERNAME"),
+        smtp_password=os.getenv("SMTP_PASSWORD"),
+        sender_email=os.getenv("SENDER_EMAIL"),
+        recipients=tuple(r for r in _CSV_SPLIT.split(default_recipient.strip()) if r),
+        website_url=os.getenv("PORT_WEBSITE_URL",
+                              "https://www.ville-saintraphael.fr/utile/la-regie-des-ports-raphaelois")
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _render_parts(wind_speed, wind_gust, threshold, location, website_url):
+    """
+    Render the plain text and HTML messages, each split around its timestamp.
+    
+    Apart from the timestamp the messages only depend on the arguments, so
+    repeated alerts for the same conditions reuse the cached parts.
+    
+    Returns:
+        tuple: ((text before, text after), (HTML before, HTML after)) the timestamp
+    """
+    # Get wind description
+    _, wind_desc = get_wind_description(wind_speed)
+    
+    fields = {
+        "location": location,
+        "wind_formatted": format_wind_speed(wind_speed),
+        "wind_desc": wind_desc,
+        "gust_formatted": format_wind_speed(wind_gust) if wind_gust else "N/A",
+        "threshold": threshold,
+        "website_url": website_url
+    }
+    
+    # $timestamp is left in place and is the last placeholder of each template
+    text_head, _, text_tail = _TEXT_TEMPLATE.safe_substitute(fields).rpartition("$timestamp")
+    html_head, _, html_tail = _HTML_TEMPLATE.safe_substitute(fields).rpartition("$timestamp")
+    return (text_head, text_tail), (html_head, html_tail)
 
 
 class SimpleSmtpNotifier:
@@ -34,89 +146,139 @@ class SimpleSmtpNotifier:
         self.config = config or {}
         
         # Load config from environment variables if not provided
-        self.smtp_server = self.config.get('smtp_server', os.getenv("SMTP_SERVER", "smtp.gmail.com"))
-        self.smtp_port = int(self.config.get('smtp_port', os.getenv("SMTP_PORT", "587")))
-        self.smtp_username = self.config.get('smtp_username', os.getenv("SMTP_USERNAME"))
-        self.smtp_password = self.config.get('smtp_password', os.getenv("SMTP_PASSWORD"))
-        self.sender_email = self.config.get('sender_email', os.getenv("SENDER_EMAIL"))
+        env = _load_env()
+        self.smtp_server = self.config.get('smtp_server', env.smtp_server)
+        self.smtp_port = int(self.config.get('smtp_port', env.smtp_port))
+        self.smtp_username = self.config.get('smtp_username', env.smtp_username)
+        self.smtp_password = self.config.get('smtp_password', env.smtp_password)
+        self.sender_email = self.config.get('sender_email', env.sender_email)
         
         # If sender email is not set, use username
         if not self.sender_email and self.smtp_username:
             self.sender_email = self.smtp_username
             
         # Default recipient or list from environment
-        default_recipient = os.getenv("RECIPIENT_EMAIL", "")
-        self.recipients = self.config.get('recipients', 
-                                        [r.strip() for r in default_recipient.split(',')] if default_recipient else [])
+        self.recipients = self.config.get('recipients', list(env.recipients))
         
         # Make sure recipients is always a list
         if isinstance(self.recipients, str):
             self.recipients = [self.recipients]
             
         # Website URL for reference in notifications
-        self.website_url = self.config.get(
-            'website_url', 
-            os.getenv("PORT_WEBSITE_URL", 
-                     "https://www.ville-saintraphael.fr/utile/la-regie-des-ports-raphaelois")
-        )
+        self.website_url = self.config.get('website_url', env.website_url)
         
         # Check if configuration is valid
-        self.is_configured = all([
-            self.smtp_server, 
-            self.smtp_username, 
-            self.smtp_password, 
-            self.sender_email, 
-            self.recipients
-        ])
+        self.is_configured = bool(
+            self.smtp_server
+            and self.smtp_username
+            and self.smtp_password
+            and self.sender_email
+            and self.recipients
+        )
+        
+        # Logged-in SMTP session, kept open between notifications until close()
+        self._smtp = None
     
     def is_valid(self):
         """Check if the email configuration is valid."""
         return self.is_configured
     
-    def create_html_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
+    def _open_session(self):
         """
-        Create HTML-formatted message content.
+        Open an SMTP session, start TLS and log in.
+        
+        Returns:
+            smtplib.SMTP: The logged-in SMTP session
+        """
+        logger.info("Connecting to SMTP server %s:%s...", self.smtp_server, self.smtp_port)
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            logger.info("Connected to SMTP server, starting TLS...")
+            server.starttls()  # Secure the connection
+            
+            logger.info("TLS started, attempting to login with username: %s...", self.smtp_username)
+            server.login(self.smtp_username, self.smtp_password)
+            logger.info("Login successful!")
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def connect(self):
+        """
+        Open a new SMTP session, kept open for later notifications.
+        
+        Returns:
+            smtplib.SMTP: The logged-in SMTP session
+        """
+        self.close()
+        self._smtp = self._open_session()
+        return self._smtp
+    
+    def _get_connection(self):
+        """
+        Return the open SMTP session if it is still alive, reconnecting otherwise.
+        
+        Returns:
+            smtplib.SMTP: A logged-in SMTP session
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP session is no longer usable, reconnecting...")
+        return self.connect()
+    
+    def close(self):
+        """Close the SMTP session if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        finally:
+            self._smtp = None
+    
+    def _render_bodies(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port", now=None):
+        """
+        Render the plain text and HTML messages together.
         
         Args:
             wind_speed (float): Current wind speed in knots
             wind_gust (float, optional): Wind gust speed in knots
             threshold (int): Wind speed threshold that triggered the notification
             location (str): Name of the location being monitored
+            now (str, optional): RFC 2822 timestamp to show, defaults to the current time
             
         Returns:
-            str: HTML-formatted message
+            tuple: (plain text message, HTML-formatted message)
         """
-        # Get wind description
-        _, wind_desc = get_wind_description(wind_speed)
-        
-        # Format wind speeds
-        wind_formatted = format_wind_speed(wind_speed)
-        gust_formatted = format_wind_speed(wind_gust) if wind_gust else "N/A"
-        
-        # Simple HTML message - no complex CSS that might be stripped by email clients
-        html = f"""
-        <html>
-        <body>
-            <h1>High Wind Alert!</h1>
-            <p>High wind conditions have been detected at <strong>{location}</strong>!</p>
-            
-            <p><strong>Current wind speed:</strong> {wind_formatted}</p>
-            <p><strong>Wind conditions:</strong> {wind_desc}</p>
-            <p><strong>Wind gusts:</strong> {gust_formatted}</p>
-            <p><strong>Alert threshold:</strong> {threshold} knots</p>
-            
-            <p><a href="{self.website_url}">View Port Website</a></p>
+        (text_head, text_tail), (html_head, html_tail) = _render_parts(
+            wind_speed, wind_gust, threshold, location, self.website_url)
+        if now is None:
+            now = formatdate(localtime=True)
+        return text_head + now + text_tail, html_head + now + html_tail
+    
+    def create_html_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port", now=None):
+        """
+        Create HTML-formatted message content.
+        
+        Args:
+            wind_speed (float): Current wind speed in knots
+            wind_gust (float, optional): Wind gust speed in knots
+            threshold (int): Wind speed threshold that triggered the notification
+            location (str): Name of the location being monitored
+            now (str, optional): RFC 2822 timestamp to show, defaults to the current time
             
-            <p style="color: #777; font-size: 0.8em;">
-                This is an automated message from Windy Notifier.<br>
-                Time: {os.popen('date').read().strip()}
-            </p>
-        </body>
-        </html>
+        Returns:
+            str: HTML-formatted message
         """
-        return html
+        return self._render_bodies(wind_speed, wind_gust, threshold, location, now)[1]
     
-    def create_text_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port"):
+    def create_text_message(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port", now=None):
         """
         Create a plain text message about wind conditions.
         
@@ -125,33 +287,12 @@ class SimpleSmtpNotifier:
             wind_gust (float, optional): Wind gust speed in knots
             threshold (int): Wind speed threshold that triggered the notification
             location (str): Name of the location being monitored
+            now (str, optional): RFC 2822 timestamp to show, defaults to the current time
             
         Returns:
             str: Plain text message
         """
-        # Get wind description
-        _, wind_desc = get_wind_description(wind_speed)
-        
-        # Format wind speeds
-        wind_formatted = format_wind_speed(wind_speed)
-        gust_formatted = format_wind_speed(wind_gust) if wind_gust else "N/A"
-        
-        text = f"""
-        High Wind Alert!
-        
-        High wind conditions have been detected at {location}!
-        
-        Current wind speed: {wind_formatted}
-        Wind conditions: {wind_desc}
-        Wind gusts: {gust_formatted}
-        Alert threshold: {threshold} knots
-        
-        Check the website for more details: {self.website_url}
-        
-        This is an automated message from Windy Notifier.
-        Time: {os.popen('date').read().strip()}
-        """
-        return text
+        return self._render_bodies(wind_speed, wind_gust, threshold, location, now)[0]
     
     def send_notification(self, wind_speed, wind_gust=None, threshold=15, location="Saint-Raphaël port", html=True):
         """
@@ -169,67 +310,122 @@ class SimpleSmtpNotifier:
         """
         if not self.is_configured:
             logger.error("Email configuration is incomplete, notification not sent")
-            logger.error(f"SMTP Server: {self.smtp_server}")
-            logger.error(f"SMTP Port: {self.smtp_port}")
-            logger.error(f"SMTP Username: {'✓ Set' if self.smtp_username else '✗ Missing'}")
-            logger.error(f"SMTP Password: {'✓ Set' if self.smtp_password else '✗ Missing'}")
-            logger.error(f"Sender Email: {self.sender_email}")
-            logger.error(f"Recipients: {', '.join(self.recipients) if self.recipients else '✗ Missing'}")
+            logger.error("SMTP Server: %s", self.smtp_server)
+            logger.error("SMTP Port: %s", self.smtp_port)
+            logger.error("SMTP Username: %s", '✓ Set' if self.smtp_username else '✗ Missing')
+            logger.error("SMTP Password: %s", '✓ Set' if self.smtp_password else '✗ Missing')
+            logger.error("Sender Email: %s", self.sender_email)
+            logger.error("Recipients: %s", ', '.join(self.recipients) if self.recipients else '✗ Missing')
             return False
         
         # Create subject
-        subject = f"High Wind Alert: {format_wind_speed(wind_speed)}"
+        subject = _SUBJECT_FMT % format_wind_speed(wind_speed)
         
-        # Create a multipart message for both text and HTML (if requested)
-        message = MIMEMultipart("alternative")
+        # Create the message, with an HTML alternative if requested
+        message = EmailMessage()
         message["Subject"] = subject
         message["From"] = self.sender_email
         
+        # One timestamp for the Date header and both message bodies
+        now = formatdate(localtime=True)
+        message["Date"] = now
+        
+        text_content, html_content = self._render_bodies(wind_speed, wind_gust, threshold, location, now)
+        
         # Always add text content first (as fallback)
-        text_content = self.create_text_message(wind_speed, wind_gust, threshold, location)
-        message.attach(MIMEText(text_content, "plain"))
+        message.set_content(text_content)
         
         # Add HTML content if requested
         if html:
-            html_content = self.create_html_message(wind_speed, wind_gust, threshold, location)
-            message.attach(MIMEText(html_content, "html"))
+            message.add_alternative(html_content, subtype="html")
+        
+        # Address everyone at once and serialize a single time
+        message["To"] = ", ".join(self.recipients)
+        payload = message.as_bytes(policy=message.policy.clone(linesep="\r\n"))
+        
+        # Large lists are shared between several SMTP sessions
+        if len(self.recipients) > _PARALLEL_RECIPIENTS:
+            return self._send_parallel(payload)
         
-        success = True
         try:
-            logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}...")
-            
-            # Create SMTP connection
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                logger.info("Connected to SMTP server, starting TLS...")
-                server.starttls()  # Secure the connection
-                
-                logger.info(f"TLS started, attempting to login with username: {self.smtp_username}...")
-                server.login(self.smtp_username, self.smtp_password)
-                logger.info("Login successful!")
-                
-                # Send to all recipients
-                for recipient in self.recipients:
-                    try:
-                        logger.info(f"Sending email to {recipient}...")
-                        message["To"] = recipient
-                        server.sendmail(self.sender_email, recipient, message.as_string())
-                        logger.info(f"Email notification sent to {recipient}")
-                    except Exception as e:
-                        logger.error(f"Failed to send email notification to {recipient}: {e}")
-                        success = False
-            
-            return success
-            
+            server = self._get_connection()
+            return self._deliver(server, payload, self.recipients)
+        except Exception as e:
+            self.close()
+            self._log_send_error(e)
+            return False
+    
+    def _send_parallel(self, payload):
+        """
+        Send a message over up to _MAX_SMTP_SESSIONS sessions at once, each
+        delivering to its own share of the recipients.
+        
+        Args:
+            payload (bytes): Serialized message
+        
+        Returns:
+            bool: True if the message was sent to every recipient, False otherwise
+        """
+        size = -(-len(self.recipients) // _MAX_SMTP_SESSIONS)
+        chunks = [self.recipients[i:i + size] for i in range(0, len(self.recipients), size)]
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(lambda chunk: self._send_chunk(payload, chunk), chunks))
+        return all(results)
+    
+    def _send_chunk(self, payload, recipients):
+        """
+        Send a message to some of the recipients over a dedicated SMTP session.
+        
+        Args:
+            payload (bytes): Serialized message
+            recipients (list): Recipients handled by this session
+        
+        Returns:
+            bool: True if the message was sent to every recipient, False otherwise
+        """
+        try:
+            with self._open_session() as server:
+                return self._deliver(server, payload, recipients)
         except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
-            if "authentication" in str(e).lower():
-                logger.error("This appears to be an authentication issue.")
-                logger.error("Make sure your username and password are correct.")
-                logger.error("For Gmail with 2FA, you need to use an App Password.")
-            elif "ssl" in str(e).lower() or "tls" in str(e).lower():
-                logger.error("This appears to be an SSL/TLS issue.")
-                logger.error(f"Make sure your SMTP port ({self.smtp_port}) is correct.")
+            self._log_send_error(e)
             return False
+    
+    def _deliver(self, server, payload, recipients):
+        """
+        Send a message to recipients in a single SMTP transaction.
+        
+        Args:
+            server (smtplib.SMTP): Logged-in SMTP session
+            payload (bytes): Serialized message
+            recipients (list): Recipient addresses
+        
+        Returns:
+            bool: True if the message was sent to every recipient, False otherwise
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending email to %s...", ", ".join(recipients))
+        refused = server.sendmail(self.sender_email, recipients, payload)
+        
+        success = True
+        for recipient in recipients:
+            if recipient in refused:
+                logger.error("Failed to send email notification to %s: %s", recipient, refused[recipient])
+                success = False
+            else:
+                logger.info("Email notification sent to %s", recipient)
+        return success
+    
+    def _log_send_error(self, e):
+        """Log a failed send, with hints for common configuration problems."""
+        logger.error("Failed to send email notification: %s", e)
+        if isinstance(e, smtplib.SMTPAuthenticationError):
+            logger.error("This appears to be an authentication issue.")
+            logger.error("Make sure your username and password are correct.")
+            logger.error("For Gmail with 2FA, you need to use an App Password.")
+        elif isinstance(e, (ssl.SSLError, smtplib.SMTPConnectError, smtplib.SMTPNotSupportedError)):
+            logger.error("This appears to be an SSL/TLS issue.")
+            logger.error("Make sure your SMTP port (%s) is correct.", self.smtp_port)
 
 
 def send_simple_smtp_notification(wind_speed, wind_gust=None, threshold=15, config=None):
@@ -245,10 +441,32 @@ def send_simple_smtp_notification(wind_speed, wind_gust=None, threshold=15, conf
     Returns:
         bool: Success status
     """
+    global _shared_notifier
+    if config is None:
+        if _shared_notifier is None:
+            _shared_notifier = SimpleSmtpNotifier()
+        notifier = _shared_notifier
+        if notifier.is_valid():
+            return notifier.send_notification(wind_speed, wind_gust, threshold)
+        return False
+    
+    # Built for this call only, so its SMTP session is not kept open
     notifier = SimpleSmtpNotifier(config)
-    if notifier.is_valid():
-        return notifier.send_notification(wind_speed, wind_gust, threshold)
-    return False
+    try:
+        if notifier.is_valid():
+            return notifier.send_notification(wind_speed, wind_gust, threshold)
+        return False
+    finally:
+        notifier.close()
+
+
+def _close_shared_notifier():
+    """Close the SMTP session of the notifier shared between calls, at exit."""
+    if _shared_notifier is not None:
+        _shared_notifier.close()
+
+
+atexit.register(_close_shared_notifier)
 
 
 # Simple test function for this module
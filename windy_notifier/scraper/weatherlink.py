@@ -6,16 +6,24 @@ This module handles extracting weather data from the WeatherLink website using S
 It focuses on extracting wind speed, wind direction, gust speed, and temperature.
 """
 
+import os
 import re
 import time
+import atexit
 import logging
+import threading
+import contextlib
 import traceback
+import multiprocessing
+import concurrent.futures
+from html.parser import HTMLParser
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -23,260 +31,745 @@ logger = logging.getLogger(__name__)
 # Default URL for Saint-Raphaël port weather
 DEFAULT_URL = "https://www.weatherlink.com/embeddablePage/show/d8f389c51427467eb5c4f266caaf78a9/summary"
 
+# Browser identity used for both the JSON feed and Selenium
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-def get_weather_data(url=DEFAULT_URL, save_debug_files=True):
+# JSON feed the embeddable page loads its current conditions from
+SUMMARY_DATA_URL = "https://www.weatherlink.com/embeddablePage/summaryData/{page_id}"
+
+# Sensor names in the JSON feed (lowercased) for each weather data key, in
+# order of preference. Names must match exactly, so readings such as
+# "Avg Wind Speed" or "Inside Temp" are never taken for the current ones.
+JSON_SENSOR_NAMES = (
+    ('wind_speed', ("wind speed",)),
+    ('gust_speed', ("wind gust speed", "wind gust", "gust speed")),
+    ('wind_direction', ("wind direction",)),
+    ('temperature', ("temperature", "temp", "outside temp")),
+)
+
+# Patterns used to recognise weather values in the page
+_WIND_VALUE_RE = re.compile(r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)', re.I)
+_TEMP_RE = re.compile(r'(\d+(?:[,.]\d+)?)\s*[°]?[CF]', re.I)
+_WIND_ELEMENTS_RE = re.compile(r'(?:wind\s+speed|mph|km/h|kts|knots)', re.I)
+_GUST_ELEMENTS_RE = re.compile(r'(?:gust|rafale|mph|km/h|kts|knots)', re.I)
+# Label of a gust value, looked for in the value's text and in its row's
+# label, so a speed is only taken as the gust when it is labeled as one
+_GUST_LABEL_RE = re.compile(r'gust|rafale', re.I)
+# Wind speed, gust speed and wind direction given with context, one named
+# group per weather data key so a single scan finds all three
+_CONTEXT_RE = re.compile(
+    r'(?P<wind_speed>wind\s+speed.*?(?P<wind_value>\d+(?:[,.]\d+)?)\s*(?P<wind_unit>mph|km/h|kts|knots))'
+    r'|(?P<gust_speed>gust.*?(?P<gust_value>\d+(?:[,.]\d+)?)\s*(?P<gust_unit>mph|km/h|kts|knots))'
+    r'|(?P<wind_direction>(?:wind|from)\s+(?P<direction>[NESW]{1,3}|North|South|East|West|Nord|Sud|Est|Ouest)\b)',
+    re.I)
+_PAGE_ID_RE = re.compile(r'/embeddablePage/show/([0-9a-f]+)')
+
+# Fields read directly from the rendered page: key, labels to look for and
+# the pattern the value must match (None accepts any text)
+LABELED_FIELDS = [
+    ('wind_speed', ["Wind Speed", "Current Wind", "Wind"], _WIND_VALUE_RE.pattern),
+    ('gust_speed', ["Wind Gust", "Gust Speed", "Gust"], _WIND_VALUE_RE.pattern),
+    ('wind_direction', ["Wind Direction"], None),
+    ('temperature', ["Temperature"], _TEMP_RE.pattern),
+]
+
+# CSS selectors for the value cell of each field, tried in order. A selector
+# lets the browser go straight to the element; fields whose selectors all miss
+# (or have none) are found by scanning for their label with XPath instead.
+# Each summary row is a label cell followed by the current value, then the
+# high or the 10-minute value.
+LABEL_TO_CSS = {
+    'wind_speed': ['td[data-l10n-id="sensor_wind_speed"] + td.col-2'],
+    # The 2-minute gust is often "--", leaving only the 10-minute one
+    'gust_speed': ['td[data-l10n-id="sensor_wind_gst_spd"] + td.col-2',
+                   'td[data-l10n-id="sensor_wind_gst_spd"] + td + td.col-2'],
+    'wind_direction': ['td[data-l10n-id="sensor_wind_direction"] + td.col-2'],
+    'temperature': ['td[data-l10n-id="sensor_temp"] + td.col-2'],
+}
+
+# Reads every labeled field in one round trip, taking the first element
+# whose text fits the field's pattern: a CSS match if any, otherwise the
+# element following a matching label, otherwise any value whose parent
+# mentions a label
+_EXTRACT_JS = """
+const data = {};
+const accepts = (text, valueRe) => text && (valueRe === null || valueRe.test(text));
+fields:
+for (const [key, labels, pattern] of arguments[0]) {
+    const valueRe = pattern === null ? null : new RegExp(pattern, 'i');
+    for (const selector of arguments[1][key] || []) {
+        const text = ((document.querySelector(selector) || {}).innerText || '').trim();
+        if (accepts(text, valueRe)) {
+            data[key] = text;
+            continue fields;
+        }
+    }
+    search:
+    for (const label of labels) {
+        const found = document.evaluate(
+            `//*[contains(text(), '${label}')]//following::*[1]`, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < found.snapshotLength; i++) {
+            const text = (found.snapshotItem(i).innerText || '').trim();
+            if (accepts(text, valueRe)) {
+                data[key] = text;
+                break search;
+            }
+        }
+    }
+    if (key in data || valueRe === null) {
+        continue;
+    }
+    // Last try: any value whose parent mentions one of the labels
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    const lowerLabels = labels.map(label => label.toLowerCase());
+    while (walker.nextNode()) {
+        const text = walker.currentNode.nodeValue.trim();
+        const parent = walker.currentNode.parentElement;
+        if (text && valueRe.test(text) && parent && parent.parentElement) {
+            const context = parent.parentElement.textContent.toLowerCase();
+            if (lowerLabels.some(label => context.includes(label))) {
+                data[key] = text;
+                break;
+            }
+        }
+    }
+}
+return data;
+"""
+
+# Element holding the current wind speed, filled in by the page's JavaScript
+WIND_SPEED_XPATH = "//*[contains(text(), 'Wind Speed')]//following::*[1]"
+
+# Chrome profile kept between runs so the page's scripts and styles stay in
+# the HTTP cache; set WINDY_CHROME_PROFILE to an empty string to browse
+# incognito instead
+CHROME_PROFILE_DIR = os.path.expanduser("~/.cache/windy-notifier/chrome")
+CHROME_DISK_CACHE_SIZE = 32 * 1024 * 1024
+
+# Set in batch workers, each of which needs a profile of its own since
+# Chrome locks a profile while it is in use
+_profile_slot = None
+
+# Extra Chrome flags for small hosts, enabled by setting WINDY_CHROME_LOWMEM=1.
+# They cut memory use several times over, but single-process mode
+# occasionally crashes, so they are off by default.
+LOWMEM_CHROME_ARGS = [
+    "--single-process",
+    "--no-zygote",
+    "--renderer-process-limit=1",
+    "--js-flags=--max-old-space-size=128",
+]
+
+
+def _lowmem_enabled():
+    """Whether WINDY_CHROME_LOWMEM asks for the low-memory Chrome flags."""
+    return os.getenv("WINDY_CHROME_LOWMEM", "") not in ("", "0")
+
+
+# Browser driver used when the JSON feed fails, "playwright" or "selenium".
+# Selenium is the default since it reuses one browser across scrapes, while
+# the Playwright scraper starts a new one on every call.
+SCRAPER_ENV = "WINDY_SCRAPER"
+
+# Seconds between the start of each scrape in a batch
+BATCH_STAGGER = 0.15
+
+# Seconds to wait for the wind speed to appear, and how often to check
+DATA_WAIT_TIMEOUT = 15
+DATA_POLL_FREQUENCY = 0.25
+
+
+def _wind_data_ready(driver):
     """
-    Extract weather data from WeatherLink using Selenium.
+    Check whether the wind speed has been rendered on the page.
     
     Args:
-        url (str): URL of the WeatherLink page to scrape
-        save_debug_files (bool): Whether to save debug files (screenshot, HTML)
+        driver: Selenium WebDriver instance
         
     Returns:
-        dict: Dictionary containing extracted weather data (wind_speed, wind_direction, 
-              gust_speed, temperature)
+        bool: True once a wind speed value with its unit is displayed
     """
-    logger.info(f"Accessing {url} with Selenium")
+    for elem in driver.find_elements(By.XPATH, WIND_SPEED_XPATH):
+        if _WIND_VALUE_RE.search(elem.text):
+            return True
+    return False
+
+
+def _make_driver():
+    """
+    Start a headless Chrome driver with a realistic browser appearance.
     
-    # Configure Chrome options with more realistic browser appearance
+    Returns:
+        webdriver.Chrome: The new driver
+    """
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    
+    # Skip resources the scraper never reads; stylesheets stay enabled since
+    # element text depends on them
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    
+    # Return from driver.get() once the DOM is ready; the wind data is
+    # waited for explicitly afterwards
+    chrome_options.page_load_strategy = 'eager'
+    
+    profile_dir = os.getenv("WINDY_CHROME_PROFILE", CHROME_PROFILE_DIR)
+    if profile_dir:
+        if _profile_slot is not None:
+            profile_dir = f"{profile_dir}-{_profile_slot}"
+        os.makedirs(profile_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_SIZE}")
+    else:
+        chrome_options.add_argument("--incognito")
+    
+    if _lowmem_enabled():
+        for argument in LOWMEM_CHROME_ARGS:
+            chrome_options.add_argument(argument)
+    
+    driver = webdriver.Chrome(options=chrome_options)
+    logger.info("Chrome driver initialized")
+    
+    if os.getenv('WINDY_DEBUG'):
+        _log_browser_memory(driver)
+    
+    # Set page load timeout
+    driver.set_page_load_timeout(30)
+    return driver
+
+
+def _log_browser_memory(driver):
+    """
+    Log the memory used by Chrome and its helper processes, if psutil is installed.
     
+    Args:
+        driver: Selenium WebDriver instance
+    """
     try:
-        # Initialize the driver
-        driver = webdriver.Chrome(options=chrome_options)
-        logger.info("Chrome driver initialized")
-        
-        # Set page load timeout
-        driver.set_page_load_timeout(30)
-        
-        # Navigate to URL
-        driver.get(url)
-        logger.info("URL loaded")
+        import psutil
+    except ImportError:
+        return
+    
+    try:
+        service = psutil.Process(driver.service.process.pid)
+        processes = [service, *service.children(recursive=True)]
+        rss = sum(process.memory_info().rss for process in processes)
+        logger.debug(f"Chrome uses {rss / 1024 / 1024:.0f} MB across {len(processes)} processes")
+    except Exception as e:
+        logger.debug(f"Could not measure Chrome memory: {str(e)}")
+
+
+class _DriverPool:
+    """
+    Keeps a single Chrome driver alive between scrapes, so each check only
+    pays for loading the page rather than for starting a browser.
+    """
+    
+    def __init__(self, max_uses=50):
+        """
+        Initialize the pool.
         
-        # Wait for content to load
-        wait = WebDriverWait(driver, 20)
-        try:
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            logger.info("Body tag found, page has loaded")
-        except Exception as e:
-            logger.warning(f"Waiting for body tag failed: {str(e)}")
+        Args:
+            max_uses (int): Number of scrapes after which the driver is restarted
+        """
+        self.max_uses = max_uses
+        self._lock = threading.Lock()
+        self._driver = None
+        self._uses = 0
+    
+    @contextlib.contextmanager
+    def acquire(self):
+        """
+        Borrow the driver for one scrape, starting it if needed.
         
-        # Wait for JavaScript to execute
-        time.sleep(8)
+        The driver is discarded if the scrape raises, since it may be left
+        in a broken state, and replaced if it no longer responds.
         
-        # Save screenshot for debugging if requested
-        if save_debug_files:
+        Yields:
+            webdriver.Chrome: The pooled driver
+        """
+        with self._lock:
+            if self._driver is not None and self._uses >= self.max_uses:
+                self._quit()
+            
+            try:
+                if self._driver is not None:
+                    try:
+                        # Stop anything left running by the previous page
+                        self._driver.execute_script("window.stop()")
+                        self._driver.delete_all_cookies()
+                    except WebDriverException as e:
+                        logger.warning(f"Pooled Selenium driver stopped responding, restarting it: {str(e)}")
+                        self._quit()
+                if self._driver is None:
+                    self._driver = _make_driver()
+                self._uses += 1
+                
+                yield self._driver
+            except BaseException:
+                self._quit()
+                raise
+    
+    def shutdown(self):
+        """Quit the pooled driver, if one is running."""
+        with self._lock:
+            self._quit()
+    
+    def _quit(self):
+        if self._driver is not None:
             try:
-                driver.save_screenshot("debug/weatherlink_debug.png")
-                logger.debug("Screenshot saved for debugging")
+                self._driver.quit()
+                logger.info("Selenium driver closed")
             except Exception as e:
-                logger.warning(f"Could not save screenshot: {str(e)}")
+                logger.warning(f"Could not close Selenium driver: {str(e)}")
+            self._driver = None
+            self._uses = 0
+
+
+# Most recent successful scrape of each URL, as (monotonic time, data),
+# reused for _CACHE_TTL seconds
+_CACHE = {}
+_CACHE_TTL = 60.0
+
+# Driver shared by all scrapes
+_pool = _DriverPool()
+atexit.register(_pool.shutdown)
+
+
+def fetch_weather_json(url=DEFAULT_URL):
+    """
+    Fetch weather data from the JSON feed behind an embeddable WeatherLink page.
+    
+    Args:
+        url (str): URL of the WeatherLink embeddable page
         
-        # Initialize weather data dictionary
-        weather_data = {}
+    Returns:
+        dict: Extracted weather data (wind_speed, wind_direction, gust_speed,
+              temperature), or None if the feed is unavailable or has changed
+    """
+    match = _PAGE_ID_RE.search(url)
+    if not match:
+        return None
+    
+    try:
+        response = requests.get(SUMMARY_DATA_URL.format(page_id=match.group(1)),
+                                headers={"User-Agent": USER_AGENT}, timeout=10)
+        response.raise_for_status()
+        conditions = response.json()["currConditionValues"]
+    except Exception as e:
+        logger.warning(f"Could not fetch WeatherLink JSON feed: {str(e)}")
+        return None
+    
+    # Conditions with a value, by sensor name
+    by_name = {}
+    for condition in conditions:
+        name = str(condition.get("sensorDataName", "")).strip().lower()
+        if condition.get("convertedValue") not in (None, "", "--"):
+            by_name.setdefault(name, condition)
+    
+    weather_data = {}
+    for key, names in JSON_SENSOR_NAMES:
+        for name in names:
+            condition = by_name.get(name)
+            if condition is not None:
+                unit = condition.get("unitLabel") or ""
+                weather_data[key] = f"{condition['convertedValue']} {unit}".strip()
+                logger.info(f"Found {key} in JSON feed: {weather_data[key]}")
+                break
+    
+    # Without a wind speed the feed is no use to the notifier
+    if 'wind_speed' not in weather_data:
+        logger.warning("WeatherLink JSON feed has no wind speed")
+        return None
+    return weather_data
+
+
+def get_weather_data(url=DEFAULT_URL, save_debug_files=False):
+    """
+    Extract weather data from WeatherLink, using Selenium when the JSON feed fails.
+    
+    Args:
+        url (str): URL of the WeatherLink page to scrape
+        save_debug_files (bool): Whether to save debug files (screenshot, HTML) when
+            the wind speed can't be found, or always if WINDY_DEBUG is set
         
-        # DIRECT TARGETING: Try to find wind elements by specific selectors first
-        try:
-            # Current Wind Speed
-            extract_element_by_label(driver, weather_data, 'wind_speed', 
-                                    ["Wind Speed", "Current Wind", "Wind"], 
-                                    r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
-            
-            # Wind Gust Speed (added as requested)
-            extract_element_by_label(driver, weather_data, 'gust_speed',
-                                    ["Wind Gust", "Gust Speed", "Gust"],
-                                    r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
-            
-            # Wind Direction
-            wind_dir_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Wind Direction')]//following::*[1]")
-            if wind_dir_elements:
-                for elem in wind_dir_elements:
-                    text = elem.text.strip()
-                    if text:
-                        weather_data['wind_direction'] = text
-                        logger.info(f"Found wind direction: {text}")
-                        break
-            
-            # Temperature
-            temp_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Temperature')]//following::*[1]")
-            if temp_elements:
-                for elem in temp_elements:
-                    text = elem.text.strip()
-                    if text and re.search(r'(\d+(?:[,.]\d+)?)\s*[°]?[CF]', text, re.I):
-                        weather_data['temperature'] = text
-                        logger.info(f"Found temperature: {text}")
-                        break
-                        
-        except Exception as e:
-            logger.warning(f"Error finding elements directly: {str(e)}")
-            
-        # If direct targeting failed, use BeautifulSoup as fallback
-        if 'wind_speed' not in weather_data or 'gust_speed' not in weather_data:
-            fallback_extraction(driver, weather_data, save_debug_files)
+    Returns:
+        dict: Dictionary containing extracted weather data (wind_speed, wind_direction, 
+              gust_speed, temperature)
+    """
+    # Conditions don't change between calls a few seconds apart
+    entry = _CACHE.get(url)
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL:
+        logger.info(f"Using weather data cached for {url}")
+        return dict(entry[1])
+    
+    weather_data = _fetch_weather_data(url, save_debug_files)
+    if weather_data:
+        _CACHE[url] = (time.monotonic(), dict(weather_data))
+    return weather_data
+
+
+def invalidate_cache():
+    """Forget all cached weather data, so the next call scrapes again."""
+    _CACHE.clear()
+
+
+def _fetch_weather_data(url, save_debug_files):
+    """
+    Extract weather data from WeatherLink, bypassing the cache.
+    
+    Args:
+        url (str): URL of the WeatherLink page to scrape
+        save_debug_files (bool): Whether to save debug files (screenshot, HTML) when
+            the wind speed can't be found, or always if WINDY_DEBUG is set
         
+    Returns:
+        dict: Dictionary containing extracted weather data
+    """
+    # The JSON feed is much cheaper than rendering the page
+    weather_data = fetch_weather_json(url)
+    if weather_data:
         return weather_data
+    
+    if _use_playwright():
+        try:
+            from windy_notifier.scraper import weatherlink_playwright
+            weather_data = weatherlink_playwright.get_weather_data(url)
+        except ImportError as e:
+            logger.warning(f"Playwright is not available, using Selenium: {str(e)}")
+        else:
+            if weather_data:
+                return weather_data
+            logger.warning("Playwright scrape found nothing, retrying with Selenium")
+    
+    logger.info(f"Accessing {url} with Selenium")
+    
+    try:
+        with _pool.acquire() as driver:
+            return _scrape(driver, url, save_debug_files)
         
     except Exception as e:
         logger.error(f"Error accessing website with Selenium: {str(e)}")
         logger.error(traceback.format_exc())
         return {}
+
+
+def _use_playwright():
+    """
+    Decide whether to scrape with Playwright rather than Selenium.
     
-    finally:
-        # Always close the driver
-        if 'driver' in locals():
-            driver.quit()
-            logger.info("Selenium driver closed")
+    Returns:
+        bool: True if WINDY_SCRAPER asks for Playwright
+    """
+    return os.getenv(SCRAPER_ENV, "").lower() == "playwright"
 
 
-def extract_element_by_label(driver, data_dict, key, labels, pattern):
+def get_weather_data_batch(urls, max_workers=4, save_debug_files=False):
     """
-    Helper function to extract element by its label and pattern.
+    Extract weather data from several WeatherLink pages in parallel.
+    
+    Each worker process runs its own Chrome driver, since a driver cannot
+    be shared between scrapes running at the same time.
+    
+    Args:
+        urls (list): URLs of the WeatherLink pages to scrape
+        max_workers (int): Maximum number of pages scraped at once
+        save_debug_files (bool): Whether to save debug files (screenshot, HTML) when
+            the wind speed can't be found, or always if WINDY_DEBUG is set
+        
+    Returns:
+        list: Weather data dictionaries, in the same order as urls
+    """
+    if len(urls) <= 1:
+        return [get_weather_data(url, save_debug_files) for url in urls]
+    
+    # Spawn fresh workers so none inherits this process's pooled driver
+    context = multiprocessing.get_context("spawn")
+    workers = min(max_workers, len(urls))
+    slots = context.Queue()
+    for slot in range(workers):
+        slots.put(slot)
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                initializer=_init_batch_worker,
+                                                initargs=(slots,)) as executor:
+        # Only the first round of scrapes starts together, so only it is staggered
+        futures = [executor.submit(_delayed_scrape, url, save_debug_files,
+                                   i * BATCH_STAGGER if i < workers else 0)
+                   for i, url in enumerate(urls)]
+        
+        results = []
+        for url, future in zip(urls, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {str(e)}")
+                results.append({})
+        return results
+
+
+def _init_batch_worker(slots):
+    """Claim a Chrome profile slot for this batch worker."""
+    global _profile_slot
+    _profile_slot = slots.get()
+
+
+def _delayed_scrape(url, save_debug_files, delay):
+    """Wait for delay seconds, then scrape url in a batch worker."""
+    time.sleep(delay)
+    return get_weather_data(url, save_debug_files)
+
+
+def _scrape(driver, url, save_debug_files):
+    """
+    Load the WeatherLink page and extract its weather data.
     
     Args:
         driver: Selenium WebDriver instance
-        data_dict: Dictionary to store the extracted data
-        key: Key to use in the data dictionary
-        labels: List of possible labels to look for
-        pattern: Regex pattern to validate the value
-    """
-    for label in labels:
-        xpath = f"//*[contains(text(), '{label}')]//following::*[1]"
-        elements = driver.find_elements(By.XPATH, xpath)
+        url (str): URL of the WeatherLink page to scrape
+        save_debug_files (bool): Whether to save debug files (screenshot, HTML) when
+            the wind speed can't be found, or always if WINDY_DEBUG is set
         
-        if elements:
-            for elem in elements:
-                text = elem.text.strip()
-                if text and re.search(pattern, text, re.I):
-                    data_dict[key] = text
-                    logger.info(f"Found {key}: {text}")
-                    return True
-    
-    # If not found by label, try to find by value format
-    value_pattern = pattern.replace('(', '').replace(')', '')
-    value_xpath = f"//*[matches(text(), '{value_pattern}')]"
+    Returns:
+        dict: Dictionary containing extracted weather data
+    """
+    # Navigate to URL
+    driver.get(url)
+    logger.info("URL loaded")
+    
+    # Wait for content to load
+    wait = WebDriverWait(driver, 20)
     try:
-        value_elements = driver.find_elements(By.XPATH, value_xpath)
-        for elem in value_elements:
-            text = elem.text.strip()
-            if text and re.search(pattern, text, re.I):
-                # Make sure this actually contains wind-related terms
-                parent = elem.find_element(By.XPATH, "./..")
-                parent_text = parent.text.lower()
-                if any(label.lower() in parent_text for label in labels):
-                    data_dict[key] = text
-                    logger.info(f"Found {key} by value: {text}")
-                    return True
-    except:
-        pass  # XPath with matches() might not be supported
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        logger.info("Body tag found, page has loaded")
+    except Exception as e:
+        logger.warning(f"Waiting for body tag failed: {str(e)}")
     
-    return False
+    # Wait for JavaScript to fill in the wind data
+    try:
+        WebDriverWait(driver, DATA_WAIT_TIMEOUT, poll_frequency=DATA_POLL_FREQUENCY).until(_wind_data_ready)
+        logger.info("Wind data rendered")
+    except Exception as e:
+        logger.warning(f"Waiting for wind data failed: {str(e)}")
+    
+    # Initialize weather data dictionary
+    weather_data = {}
+    
+    # DIRECT TARGETING: Read the labeled fields straight from the page first
+    try:
+        found = driver.execute_script(_EXTRACT_JS, LABELED_FIELDS, LABEL_TO_CSS) or {}
+        for key, text in found.items():
+            weather_data[key] = text
+            logger.info(f"Found {key}: {text}")
+    except Exception as e:
+        logger.warning(f"Error finding elements directly: {str(e)}")
+    
+    # If direct targeting failed, parse the page source as fallback
+    if 'wind_speed' not in weather_data or 'gust_speed' not in weather_data:
+        fallback_extraction(driver, weather_data, save_debug_files)
+    
+    # Save screenshot for debugging if requested
+    if _debug_wanted(save_debug_files, weather_data):
+        try:
+            _write_debug_file("debug/weatherlink_debug.png", driver.get_screenshot_as_png())
+        except Exception as e:
+            logger.warning(f"Could not save screenshot: {str(e)}")
+    
+    return weather_data
 
 
-def fallback_extraction(driver, weather_data, save_debug_files):
+def _debug_wanted(save_debug_files, weather_data):
     """
-    Fallback extraction method using BeautifulSoup when direct targeting fails.
+    Decide whether to save debug files for a scrape.
     
     Args:
-        driver: Selenium WebDriver instance
-        weather_data: Dictionary to store weather data
-        save_debug_files: Whether to save debug files
+        save_debug_files (bool): Whether debug files were requested
+        weather_data (dict): Data extracted so far
+        
+    Returns:
+        bool: True if the files are requested and the scrape needs diagnosing
     """
-    logger.info("Direct targeting failed, using BeautifulSoup fallback")
-    page_source = driver.page_source
+    return save_debug_files and ('wind_speed' not in weather_data or bool(os.getenv('WINDY_DEBUG')))
+
+
+def _write_debug_file(path, content):
+    """
+    Write a debug file in the background, so the scrape isn't held up by disk I/O.
     
-    # Save the HTML only if direct targeting failed and debug files are enabled
-    if save_debug_files:
-        with open("debug/last_weatherlink_page.html", 'w', encoding='utf-8') as f:
-            f.write(page_source)
+    Args:
+        path (str): File to write
+        content (str or bytes): Contents of the file
+    """
+    def write():
+        # Write to a temporary file first so readers never see a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if isinstance(content, bytes):
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            os.replace(tmp_path, path)
+            logger.debug(f"Debug file saved: {path}")
+        except Exception as e:
+            logger.warning(f"Could not save debug file {path}: {str(e)}")
     
-    soup = BeautifulSoup(page_source, 'html.parser')
+    threading.Thread(target=write, daemon=True).start()
+
+
+class _StopParsing(Exception):
+    """Raised by the stream parser once nothing is left to look for."""
+
+
+class _WindyStreamParser(HTMLParser):
+    """
+    Streams the visible text of a page, picking up wind and gust speeds as
+    it goes instead of building a document tree.
     
-    # Look for wind speed if not already found
-    if 'wind_speed' not in weather_data:
-        wind_elements = soup.find_all(string=re.compile(r'(?:wind\s+speed|mph|km/h|kts|knots)', re.I))
-        extract_from_elements(wind_elements, weather_data, 'wind_speed', r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
+    Parsing stops with _StopParsing as soon as the wind speed, gust speed
+    and wind direction are all known, since nothing else is read from the page.
+    """
     
-    # Look for gust speed if not already found
-    if 'gust_speed' not in weather_data:
-        gust_elements = soup.find_all(string=re.compile(r'(?:gust|rafale|mph|km/h|kts|knots)', re.I))
-        extract_from_elements(gust_elements, weather_data, 'gust_speed', r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
+    def __init__(self, weather_data):
+        """
+        Initialize the parser.
+        
+        Args:
+            weather_data (dict): Dictionary to store weather data
+        """
+        super().__init__()
+        self.weather_data = weather_data
+        self.texts = []
+        self._skip_depth = 0
+        self._label = ""
+        self._searches = [(key, elements_re) for key, elements_re in
+                          (('wind_speed', _WIND_ELEMENTS_RE), ('gust_speed', _GUST_ELEMENTS_RE))
+                          if key not in weather_data]
     
-    # Last resort: extract from all text
-    all_text = soup.get_text(separator='\n', strip=True)
+    def done(self):
+        """Whether every field read from the page text is already known."""
+        return not self._searches and 'wind_direction' in self.weather_data
     
-    # Wind speed
-    if 'wind_speed' not in weather_data:
-        extract_from_text(all_text, weather_data, 'wind_speed', r'wind\s+speed.*?(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)', 
-                         r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
     
-    # Gust speed
-    if 'gust_speed' not in weather_data:
-        extract_from_text(all_text, weather_data, 'gust_speed', r'gust.*?(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)',
-                         r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)')
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip_depth:
+            self._skip_depth -= 1
     
-    # Wind direction if not already found
-    if 'wind_direction' not in weather_data:
-        dir_match = re.search(r'(?:wind|from)\s+([NESW]{1,3}|North|South|East|West|Nord|Sud|Est|Ouest)', all_text, re.I)
-        if dir_match:
-            weather_data['wind_direction'] = dir_match.group(1)
-            logger.info(f"Extracted wind direction: {weather_data['wind_direction']}")
+    def handle_data(self, data):
+        text = data.strip()
+        if self._skip_depth or not text:
+            return
+        self.texts.append(text)
+        
+        match = _WIND_VALUE_RE.search(text) if self._searches else None
+        if match:
+            # A gust row's value is not the wind speed, and only a gust row's
+            # value is the gust
+            is_gust = bool(_GUST_LABEL_RE.search(text) or _GUST_LABEL_RE.search(self._label))
+            for key, elements_re in list(self._searches):
+                if (key == 'gust_speed') != is_gust:
+                    continue
+                if elements_re.search(text):
+                    self.weather_data[key] = match.group(0)
+                    logger.info(f"Extracted {key} from text: {self.weather_data[key]}")
+                    self._searches.remove((key, elements_re))
+        elif text[0].isalpha() and not any(c.isdigit() for c in text):
+            # Words without numbers label the values that follow them
+            self._label = text
+        
+        if self.done():
+            raise _StopParsing
 
 
-def extract_from_elements(elements, data_dict, key, pattern):
+def fallback_extraction(driver, weather_data, save_debug_files):
     """
-    Extract data from a list of elements using a pattern.
+    Fallback extraction method parsing the page source when direct targeting fails.
     
     Args:
-        elements: List of BeautifulSoup elements
-        data_dict: Dictionary to store the extracted data
-        key: Key to use in the data dictionary
-        pattern: Regex pattern to match
-    """
-    if elements:
-        for elem in elements:
-            text = elem.strip()
-            match = re.search(pattern, text, re.I)
-            if match:
-                data_dict[key] = match.group(0)
-                logger.info(f"Extracted {key} from text: {data_dict[key]}")
-                return True
-    return False
+        driver: Selenium WebDriver instance
+        weather_data: Dictionary to store weather data
+        save_debug_files: Whether to save debug files
+    """
+    logger.info("Direct targeting failed, parsing the page source")
+    page_source = driver.page_source
+    
+    _extract_from_page(page_source, weather_data)
+    
+    # Save the HTML only if the fallback is being diagnosed
+    if _debug_wanted(save_debug_files, weather_data):
+        _write_debug_file("debug/last_weatherlink_page.html", page_source)
+
+
+def _extract_from_page(page_source, weather_data):
+    """
+    Extract missing weather data from the text of a page.
+    
+    Args:
+        page_source (str): HTML of the page
+        weather_data (dict): Dictionary to store weather data
+    """
+    # Look for wind and gust speeds not already found while streaming the page
+    parser = _WindyStreamParser(weather_data)
+    if parser.done():
+        return
+    try:
+        parser.feed(page_source)
+        parser.close()
+    except _StopParsing:
+        return
+    
+    # Last resort: extract from all text, finding every missing field
+    # given with context in one scan
+    all_text = '\n'.join(parser.texts)
+    missing = {key for key in ('wind_speed', 'gust_speed', 'wind_direction') if key not in weather_data}
+    for match in _CONTEXT_RE.finditer(all_text):
+        key = match.lastgroup
+        if key not in missing:
+            continue
+        if key == 'wind_direction':
+            weather_data[key] = match.group('direction')
+        else:
+            prefix = key.split('_')[0]
+            weather_data[key] = _format_speed(match.group(f'{prefix}_value'), match.group(f'{prefix}_unit'))
+        logger.info(f"Extracted {key} with context: {weather_data[key]}")
+        missing.discard(key)
+        if not missing:
+            return
+    
+    # Fall back to just finding any speed for the ones still missing
+    speeds = [key for key in ('wind_speed', 'gust_speed') if key in missing]
+    match = _WIND_VALUE_RE.search(all_text) if speeds else None
+    if match:
+        for key in speeds:
+            weather_data[key] = _format_speed(match.group(1), match.group(2))
+            logger.info(f"Extracted {key} from all text: {weather_data[key]}")
 
 
-def extract_from_text(text, data_dict, key, context_pattern, fallback_pattern):
+def _format_speed(value, unit):
     """
-    Extract data from text using patterns.
+    Format a speed found in the page text.
     
     Args:
-        text: Text to search in
-        data_dict: Dictionary to store the extracted data
-        key: Key to use in the data dictionary
-        context_pattern: Pattern with context
-        fallback_pattern: Pattern without context
-    """
-    # Try with context first
-    context_match = re.search(context_pattern, text, re.I)
-    if context_match:
-        # Replace comma with period for consistent decimal parsing
-        value = context_match.group(1).replace(',', '.')
-        unit = context_match.group(2)
-        data_dict[key] = f"{value} {unit}"
-        logger.info(f"Extracted {key} with context: {data_dict[key]}")
-        return True
-    
-    # Fallback to just finding any matching pattern
-    fallback_match = re.search(fallback_pattern, text, re.I)
-    if fallback_match:
-        # Replace comma with period for consistent decimal parsing
-        value = fallback_match.group(1).replace(',', '.')
-        unit = fallback_match.group(2)
-        data_dict[key] = f"{value} {unit}"
-        logger.info(f"Extracted {key} from all text: {data_dict[key]}")
-        return True
+        value (str): Number as found, possibly with a decimal comma
+        unit (str): Unit as found
         
-    return False 
\ No newline at end of file
+    Returns:
+        str: The speed, with a decimal point for consistent parsing
+    """
+    return f"{value.replace(',', '.')} {unit}"
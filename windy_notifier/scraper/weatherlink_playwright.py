@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+WeatherLink Playwright Scraper Module
+
+This module extracts weather data from the WeatherLink website using Playwright.
+It reads the same fields as the Selenium scraper, but drives Chromium through
+Playwright's async API, blocking resources the page doesn't need.
+"""
+
+import asyncio
+import logging
+import traceback
+from playwright.async_api import async_playwright
+
+from windy_notifier.scraper.weatherlink import (
+    DEFAULT_URL, USER_AGENT, DATA_WAIT_TIMEOUT, DATA_POLL_FREQUENCY, LOWMEM_CHROME_ARGS,
+    LABELED_FIELDS, LABEL_TO_CSS, _EXTRACT_JS, _extract_from_page, _lowmem_enabled,
+)
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Resource types the scraper never reads; stylesheets are kept since element
+# text depends on them
+BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+
+# The Selenium extraction script, wrapped as a function of its arguments
+_EXTRACT_FN = f"function (args) {{ return (function () {{ {_EXTRACT_JS} }}).apply(null, args); }}"
+
+# Truthy once the wind speed has been rendered
+_READY_FN = f"args => ({_EXTRACT_FN})(args).wind_speed"
+
+
+async def _route(route):
+    """Abort requests for blocked resource types and let the rest through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def get_weather_data_async(url=DEFAULT_URL):
+    """
+    Extract weather data from WeatherLink using Playwright.
+    
+    Args:
+        url (str): URL of the WeatherLink page to scrape
+    
+    Returns:
+        dict: Dictionary containing extracted weather data (wind_speed, wind_direction,
+              gust_speed, temperature)
+    """
+    logger.info(f"Accessing {url} with Playwright")
+    args = [LABELED_FIELDS, LABEL_TO_CSS]
+    
+    try:
+        async with async_playwright() as p:
+            launch_args = ["--no-sandbox", "--disable-dev-shm-usage"]
+            if _lowmem_enabled():
+                launch_args += LOWMEM_CHROME_ARGS
+            browser = await p.chromium.launch(headless=True, args=launch_args)
+            try:
+                page = await browser.new_page(user_agent=USER_AGENT, viewport={"width": 1920, "height": 1080})
+                await page.route("**/*", _route)
+                
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                logger.info("URL loaded")
+                
+                # Wait for JavaScript to fill in the wind data
+                try:
+                    await page.wait_for_function(_READY_FN, arg=args, timeout=DATA_WAIT_TIMEOUT * 1000,
+                                                 polling=DATA_POLL_FREQUENCY * 1000)
+                    logger.info("Wind data rendered")
+                except Exception as e:
+                    logger.warning(f"Waiting for wind data failed: {str(e)}")
+                
+                weather_data = {}
+                try:
+                    found = await page.evaluate(_EXTRACT_FN, args) or {}
+                    for key, text in found.items():
+                        weather_data[key] = text
+                        logger.info(f"Found {key}: {text}")
+                except Exception as e:
+                    logger.warning(f"Error finding elements directly: {str(e)}")
+                
+                # If direct targeting failed, parse the page source as fallback
+                if 'wind_speed' not in weather_data or 'gust_speed' not in weather_data:
+                    logger.info("Direct targeting failed, parsing the page source")
+                    _extract_from_page(await page.content(), weather_data)
+                
+                return weather_data
+            finally:
+                await browser.close()
+                logger.info("Playwright browser closed")
+    
+    except Exception as e:
+        logger.error(f"Error accessing website with Playwright: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {}
+
+
+def get_weather_data(url=DEFAULT_URL):
+    """
+    Extract weather data from WeatherLink using Playwright, from synchronous code.
+    
+    Args:
+        url (str): URL of the WeatherLink page to scrape
+    
+    Returns:
+        dict: Dictionary containing extracted weather data
+    """
+    return asyncio.run(get_weather_data_async(url))
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Test Converters Module
+
+This module checks that every implementation of the wind speed converters
+agrees: the pure Python functions, the Numba kernels, the kernels built ahead
+of time by build_native.py and the NumPy array variants. Speeds are swept
+across every Beaufort boundary, along with NaN and infinities, where the
+implementations are most likely to drift apart. Backends that are not
+installed are reported as skipped.
+"""
+
+import sys
+import math
+import logging
+import argparse
+from pathlib import Path
+
+# Add parent directory to path to allow imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from windy_notifier.utils import converters
+from windy_notifier.utils.converters import (
+    convert_to_knots, convert_and_classify, convert_and_classify_batch, convert_to_knots_for_unit,
+    convert_to_knots_array, parse_wind_data, parse_and_classify_fast, get_beaufort_index,
+    get_wind_description, get_wind_description_array, quantize_wind_speeds,
+)
+
+# Unknown units are expected here, so their warnings are only noise
+logging.getLogger("windy_notifier.utils.converters").setLevel(logging.ERROR)
+
+# Speeds in knots around every Beaufort boundary, plus the special values
+SPEEDS = sorted({0.0, -1.0, 1000.0, math.inf, -math.inf} | {
+    bound + delta for bound in converters._BEAUFORT_UPPERS for delta in (-0.5, -1e-9, 0.0, 1e-9, 0.5)
+}) + [math.nan]
+
+# Units of every unit id, and text for the parsers
+UNITS = ["knots", "km/h", "mph", "m/s"]
+TEXTS = ["12 kts", "12,5 km/h", "3.5 Knots", "20 MPH", "7", "5 Knots", "5 ktſ", "no wind", ""]
+
+
+def _same(a, b):
+    """Whether two numbers are equal, counting NaN as equal to NaN."""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b or math.isclose(a, b, rel_tol=1e-12)
+
+
+def _report(name, failures):
+    """Print the outcome of a check and return whether it passed."""
+    if failures:
+        print(f"❌ {name}: {len(failures)} mismatches, first: {failures[0]}")
+        return False
+    print(f"✅ {name}")
+    return True
+
+
+def _skip(name, reason):
+    """Print that a check was skipped; skipped checks don't fail the run."""
+    print(f"⚠️ {name} skipped: {reason}")
+    return True
+
+
+def _scalar_backends():
+    """
+    Collect the scalar convert-and-classify kernels that are available.
+    
+    Returns:
+        dict: Kernel taking (value, unit_id) by backend name
+    """
+    backends = {"python": converters._convert_and_classify}
+    
+    try:
+        from windy_notifier.utils import _kernels
+        backends["numba"] = _kernels.convert_and_classify
+    except ImportError as e:
+        _skip("Numba kernels", e)
+    
+    try:
+        from windy_notifier.utils import _converters_native as native
+        backends["native"] = lambda value, unit_id: (
+            native.convert_to_knots_f64(value, unit_id),
+            native.beaufort_index_f64(native.convert_to_knots_f64(value, unit_id)))
+    except ImportError:
+        _skip("Native kernels", "not built, run python -m windy_notifier.utils.build_native")
+    
+    return backends
+
+
+def test_scalar_kernels():
+    """
+    Test that every scalar kernel classifies like get_beaufort_index.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Scalar Kernels =====")
+    success = True
+    for name, kernel in _scalar_backends().items():
+        failures = []
+        for unit_id, unit in enumerate(UNITS):
+            for speed in SPEEDS:
+                knots, number = kernel(speed, unit_id)
+                expected_knots = convert_to_knots(speed, unit)
+                if not _same(knots, expected_knots) or number != get_beaufort_index(expected_knots):
+                    failures.append((unit, speed, knots, number))
+        success = _report(f"{name} kernel", failures) and success
+    
+    # The public wrapper, whichever kernel it picked
+    failures = [(speed, convert_and_classify(speed, "knots")) for speed in SPEEDS
+                if convert_and_classify(speed, "knots")[1] != get_beaufort_index(speed)]
+    return _report("convert_and_classify", failures) and success
+
+
+def test_descriptions():
+    """
+    Test that get_wind_description numbers agree with get_beaufort_index.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Descriptions =====")
+    failures = []
+    for speed in SPEEDS:
+        number, description = get_wind_description(speed)
+        expected = "Unknown" if math.isnan(speed) else converters._BEAUFORT_DESCS[get_beaufort_index(speed)]
+        if number != get_beaufort_index(speed) or description != expected:
+            failures.append((speed, number, description))
+    if get_wind_description(None) != (0, "Unknown"):
+        failures.append((None, get_wind_description(None)))
+    return _report("get_wind_description", failures)
+
+
+def test_unit_converters():
+    """
+    Test that the specialized unit converters agree with convert_to_knots.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Unit Converters =====")
+    failures = []
+    for unit in UNITS + ["KTS", "unknown"]:
+        converter = convert_to_knots_for_unit(unit)
+        for speed in SPEEDS:
+            if not _same(converter(speed), convert_to_knots(speed, unit)):
+                failures.append((unit, speed))
+    return _report("convert_to_knots_for_unit", failures)
+
+
+def test_parsers():
+    """
+    Test that parse_and_classify_fast agrees with the parse, convert and
+    describe functions called one after another.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Parsers =====")
+    failures = []
+    for text in TEXTS:
+        value, unit = parse_wind_data(text)
+        result = parse_and_classify_fast(text)
+        if value is None:
+            if result is not None:
+                failures.append((text, result))
+            continue
+        knots = convert_to_knots(value, unit)
+        number, description = get_wind_description(knots)
+        if result != (value, unit, knots, number, description):
+            failures.append((text, result))
+    return _report("parse_and_classify_fast", failures)
+
+
+def test_array_converters():
+    """
+    Test that the NumPy array converters agree with the scalar ones, with and
+    without the Numba batch kernel.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Array Converters =====")
+    try:
+        converters._require_numpy()
+    except ImportError as e:
+        return _skip("Array converters", e)
+    np = converters.np
+    success = True
+    
+    speeds = np.array(SPEEDS)
+    expected_numbers = [get_beaufort_index(speed) for speed in SPEEDS]
+    
+    failures = []
+    for unit in UNITS:
+        knots = convert_to_knots_array(speeds, unit)
+        failures += [(unit, speed) for speed, value in zip(SPEEDS, knots.tolist())
+                     if not _same(value, convert_to_knots(speed, unit))]
+    success = _report("convert_to_knots_array", failures) and success
+    
+    numbers, descriptions = get_wind_description_array(speeds)
+    failures = [(speed, number, description)
+                for speed, number, description in zip(SPEEDS, numbers.tolist(), descriptions.tolist())
+                if (number, description) != get_wind_description(speed)]
+    success = _report("get_wind_description_array", failures) and success
+    
+    # Rounding up to whole knots keeps every Beaufort number
+    quantized = quantize_wind_speeds(speeds)
+    numbers, _ = get_wind_description_array(quantized)
+    failures = [(speed, number) for speed, number, expected in zip(SPEEDS, numbers.tolist(), expected_numbers)
+                if number != expected]
+    success = _report("quantize_wind_speeds", failures) and success
+    
+    # The Numba batch kernel if installed, then the NumPy fallback
+    batch_kernel = converters._load_batch_kernel()
+    backends = [("numpy", None)]
+    if batch_kernel is not None:
+        backends.insert(0, ("numba", batch_kernel))
+    else:
+        _skip("Numba batch kernel", "Numba is not installed")
+    try:
+        for name, kernel in backends:
+            converters._batch_kernel = kernel
+            failures = []
+            for unit in UNITS:
+                knots, numbers = convert_and_classify_batch(speeds, unit)
+                for speed, value, number in zip(SPEEDS, knots.tolist(), numbers.tolist()):
+                    expected_knots = convert_to_knots(speed, unit)
+                    if not _same(value, expected_knots) or number != get_beaufort_index(expected_knots):
+                        failures.append((unit, speed, value, number))
+            success = _report(f"convert_and_classify_batch ({name})", failures) and success
+    finally:
+        converters._batch_kernel = batch_kernel
+    
+    return success
+
+
+def main():
+    """Main function to run the converter tests."""
+    parser = argparse.ArgumentParser(description='Test the Windy Notifier converters.')
+    parser.add_argument('--offline', action='store_true',
+                      help='Accepted for test.py --args; these tests never use the network')
+    parser.parse_args()
+    
+    success = True
+    for test in (test_scalar_kernels, test_descriptions, test_unit_converters, test_parsers,
+                 test_array_converters):
+        success = test() and success
+    
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,18 +3,27 @@
 Test Scraper Module
 
 This module tests the extraction of wind data from the WeatherLink page.
-It verifies that Selenium is configured correctly and can extract wind data.
+It first checks the extraction logic against fixture HTML with a mocked
+driver, the JSON feed against a saved response and the CSS selectors against
+a saved page, then verifies that Selenium is configured correctly and can
+extract wind data from the live page.
 """
 
 import os
+import re
+import json
 import sys
+import argparse
 import logging
+from unittest import mock
+from html.parser import HTMLParser
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+from windy_notifier.scraper import weatherlink
 from windy_notifier.scraper.weatherlink import get_weather_data
 from windy_notifier.utils.converters import parse_wind_data, convert_to_knots, get_wind_description
 
@@ -28,6 +37,219 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Start every test run from a fresh browser profile
+os.environ.setdefault("WINDY_CHROME_PROFILE", "")
+
+# Summary page saved from a live scrape, for the selector test. It is a copy
+# kept with the tests, since the scraper overwrites its debug files.
+PAGE_FIXTURE = Path(__file__).resolve().parent / "weatherlink_page.html"
+
+# Response of the WeatherLink JSON feed, with readings listed before the
+# current ones they could be mistaken for, for the JSON feed test
+FEED_FIXTURE = Path(__file__).resolve().parent / "weatherlink_summary.json"
+
+# Elements without an end tag, and the compound parts of the CSS selectors
+# used by the scraper: a tag, then [attribute="value"] and .class filters
+_VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'}
+_COMPOUND_RE = re.compile(r'^(\w*)((?:\[[\w-]+="[^"]*"\]|\.[\w-]+)*)$')
+_FILTER_RE = re.compile(r'\[([\w-]+)="([^"]*)"\]|\.([\w-]+)')
+
+# Summary page as rendered by WeatherLink, for the offline test
+FIXTURE_HTML = """
+<html><body>
+  <div class="summary">
+    <div><span>Wind Speed</span> <span>12,5 km/h</span></div>
+    <div><span>Wind Gust</span> <span>18,0 km/h</span></div>
+    <div><span>Wind Direction</span> <span>from NE</span></div>
+    <div><span>Temperature</span> <span>21.3 °C</span></div>
+  </div>
+</body></html>
+"""
+
+
+def test_offline_extraction():
+    """
+    Test the extraction logic on fixture HTML, without a browser or network.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing Offline Extraction =====")
+    
+    # A driver whose direct lookups only find the temperature, forcing the
+    # page source fallback for the wind
+    fake_driver = mock.MagicMock(page_source=FIXTURE_HTML)
+    fake_driver.find_elements.return_value = [mock.MagicMock(text="12,5 km/h")]
+    fake_driver.execute_script.return_value = {'temperature': '21.3 °C'}
+    
+    weatherlink.invalidate_cache()
+    with mock.patch.object(weatherlink, "fetch_weather_json", return_value=None), \
+         mock.patch.object(weatherlink, "_use_playwright", return_value=False), \
+         mock.patch.object(weatherlink, "_make_driver", return_value=fake_driver):
+        try:
+            weather_data = get_weather_data(url="https://example.invalid/offline")
+        finally:
+            weatherlink._pool.shutdown()
+    
+    print(f"Extracted Weather Data: {weather_data}")
+    expected = {'wind_speed': '12,5 km/h', 'gust_speed': '18,0 km/h',
+                'wind_direction': 'NE', 'temperature': '21.3 °C'}
+    success = all(weather_data.get(key) == value for key, value in expected.items())
+    
+    if success:
+        print("✅ Offline extraction works")
+    else:
+        print(f"❌ Offline extraction failed, expected {expected}")
+    return success
+
+
+def test_json_feed():
+    """
+    Test reading the saved JSON feed response, with the HTTP request mocked.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing JSON Feed =====")
+    
+    response = mock.MagicMock()
+    response.json.return_value = json.loads(FEED_FIXTURE.read_text(encoding="utf-8"))
+    with mock.patch.object(weatherlink.requests, "get", return_value=response) as get:
+        weather_data = weatherlink.fetch_weather_json(weatherlink.DEFAULT_URL)
+    
+    print(f"Extracted Weather Data: {weather_data}")
+    expected = {'wind_speed': '3,5 knots', 'gust_speed': '4,1 knots',
+                'wind_direction': 'SW', 'temperature': '14,7 °C'}
+    success = weather_data == expected and get.call_count == 1
+    
+    if success:
+        print("✅ JSON feed extraction works")
+    else:
+        print(f"❌ JSON feed extraction failed, expected {expected}")
+    return success
+
+
+class _Element:
+    """An element of a parsed page, with its attributes, children and text."""
+    
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = {name: value or "" for name, value in attrs}
+        self.parent = parent
+        self.children = []
+        self.texts = []
+    
+    def text(self):
+        """Whitespace-collapsed text of the element, like innerText."""
+        parts = list(self.texts)
+        for child in self.children:
+            parts.append(child.text())
+        return " ".join(" ".join(parts).split())
+
+
+class _TreeParser(HTMLParser):
+    """Builds a tree of _Element from a page, enough to match simple selectors."""
+    
+    def __init__(self):
+        super().__init__()
+        self.root = _Element("", [], None)
+        self.elements = []
+        self._current = self.root
+    
+    def handle_starttag(self, tag, attrs):
+        element = _Element(tag, attrs, self._current)
+        self._current.children.append(element)
+        self.elements.append(element)
+        if tag not in _VOID_TAGS:
+            self._current = element
+    
+    def handle_endtag(self, tag):
+        # Close up to the matching element, ignoring stray end tags
+        element = self._current
+        while element is not self.root and element.tag != tag:
+            element = element.parent
+        if element is not self.root:
+            self._current = element.parent
+    
+    def handle_data(self, data):
+        self._current.texts.append(data)
+
+
+def _matches_compound(element, compound):
+    """Whether element matches one compound selector, such as td[a="b"].c."""
+    match = _COMPOUND_RE.match(compound)
+    if not match:
+        raise ValueError(f"Unsupported selector: {compound}")
+    if match.group(1) and element.tag != match.group(1):
+        return False
+    for name, value, class_name in _FILTER_RE.findall(match.group(2)):
+        if class_name:
+            if class_name not in element.attrs.get("class", "").split():
+                return False
+        elif element.attrs.get(name) != value:
+            return False
+    return True
+
+
+def _select_one(elements, selector):
+    """
+    Find the first element matching a selector of compounds joined by the
+    adjacent sibling combinator, the only kind LABEL_TO_CSS uses.
+    
+    Args:
+        elements (list): Elements of the page in document order
+        selector (str): CSS selector
+        
+    Returns:
+        _Element: The first matching element, or None
+    """
+    compounds = [part.strip() for part in selector.split("+")]
+    for element in elements:
+        candidate = element
+        for compound in reversed(compounds):
+            if candidate is None or not _matches_compound(candidate, compound):
+                break
+            siblings = candidate.parent.children
+            index = siblings.index(candidate)
+            candidate = siblings[index - 1] if index else None
+        else:
+            return element
+    return None
+
+
+def test_css_selectors():
+    """
+    Test that the CSS selectors of the direct lookup find every field on the
+    saved WeatherLink page.
+    
+    Returns:
+        bool: True if the test succeeds
+    """
+    print("\n===== Testing CSS Selectors =====")
+    
+    parser = _TreeParser()
+    parser.feed(PAGE_FIXTURE.read_text(encoding="utf-8"))
+    parser.close()
+    
+    success = True
+    for key, _, pattern in weatherlink.LABELED_FIELDS:
+        # Same rule as the page script: the first selector whose text fits
+        text = None
+        for selector in weatherlink.LABEL_TO_CSS.get(key, []):
+            element = _select_one(parser.elements, selector)
+            candidate = element.text() if element else ""
+            if candidate and (pattern is None or re.search(pattern, candidate, re.I)):
+                text = candidate
+                break
+        print(f"  - {key}: {text}")
+        success = success and text is not None
+    
+    if success:
+        print("✅ Every field has a matching CSS selector")
+    else:
+        print("❌ Some fields are not found by their CSS selectors")
+    return success
+
 
 def test_wind_data_extraction():
     """
@@ -45,7 +267,7 @@ def test_wind_data_extraction():
     try:
         # Get weather data
         print("Accessing WeatherLink page...")
-        weather_data = get_weather_data()
+        weather_data = get_weather_data(save_debug_files=True)
         
         # Show all extracted data
         print("\nExtracted Weather Data:")
@@ -101,7 +323,18 @@ def test_wind_data_extraction():
 
 def main():
     """Main function to run the scraper test."""
-    success = test_wind_data_extraction()
+    parser = argparse.ArgumentParser(description='Test the Windy Notifier scraper.')
+    parser.add_argument('--offline', action='store_true',
+                      help='Only run the offline test, skipping the slow live scrape')
+    args = parser.parse_args()
+    
+    success = test_offline_extraction()
+    success = test_json_feed() and success
+    success = test_css_selectors() and success
+    if args.offline:
+        return 0 if success else 1
+    
+    success = test_wind_data_extraction() and success
     
     print("\n===== Troubleshooting Tips =====")
     print("If the test failed, check the following:")
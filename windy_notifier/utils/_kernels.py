@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Numba Converter Kernels
+
+This module holds the Numba-compiled numeric core of the converters. Importing
+Numba takes a few hundred milliseconds, so the converters only import this
+module on first use of the fused and batch conversions. build_native.py
+compiles the same functions ahead of time.
+"""
+
+from numba import njit, prange
+
+from .converters import _UNIT_FACTORS, _BEAUFORT_UPPERS
+
+
+@njit(cache=True)
+def beaufort_index(speed_knots):
+    """Beaufort number of a wind speed in knots; NaN (unknown) gets 0."""
+    for i in range(len(_BEAUFORT_UPPERS)):
+        # Written as "not greater" so NaN stops at 0, like bisect_left
+        if not speed_knots > _BEAUFORT_UPPERS[i]:
+            return i
+    return len(_BEAUFORT_UPPERS)
+
+
+@njit(cache=True)
+def convert_to_knots(value, unit_id):
+    """Speed in knots, for a unit given by its id."""
+    return value * _UNIT_FACTORS[unit_id]
+
+
+@njit(cache=True)
+def convert_and_classify(value, unit_id):
+    """Speed in knots and its Beaufort number, for a unit given by its id."""
+    knots = convert_to_knots(value, unit_id)
+    return knots, beaufort_index(knots)
+
+
+@njit(parallel=True, cache=True)
+def convert_and_classify_batch(values, unit_id, out_knots, out_numbers):
+    """Fill out_knots and out_numbers for every value, spread across cores."""
+    factor = _UNIT_FACTORS[unit_id]
+    for i in prange(values.shape[0]):
+        knots = values[i] * factor
+        out_knots[i] = knots
+        out_numbers[i] = beaufort_index(knots)
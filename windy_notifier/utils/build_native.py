@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Native Converters Build Script
+
+This script compiles the numeric core of the converters ahead of time with
+Numba, producing the _converters_native extension module next to this file.
+When that module is present, the converters use it instead of compiling the
+same code at run time, so a freshly started notifier pays no JIT warmup.
+
+Run it once after installing Numba and again whenever the unit factors or
+the Beaufort scale change:
+
+    python -m windy_notifier.utils.build_native
+"""
+
+import sys
+from pathlib import Path
+
+from numba.pycc import CC
+
+from windy_notifier.utils import _kernels
+
+cc = CC('_converters_native')
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+
+# Thin wrappers, so the kernels are written once in _kernels
+@cc.export('convert_to_knots_f64', 'f8(f8, i4)')
+def convert_to_knots_f64(value, unit_id):
+    return _kernels.convert_to_knots(value, unit_id)
+
+
+@cc.export('beaufort_index_f64', 'i4(f8)')
+def beaufort_index_f64(speed_knots):
+    return _kernels.beaufort_index(speed_knots)
+
+
+def main():
+    """Compile the extension module."""
+    cc.compile()
+    print(f"Built _converters_native in {cc.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,144 @@ This module provides utility functions for converting between different units
 of measurement and parsing values from text.
 """
 
-import re
+import bisect
+import itertools
 import logging
 
+# RE2 matches in linear time without backtracking; fall back to re without it
+try:
+    import re2 as _re_engine
+except ImportError:
+    import re as _re_engine
+
+# NumPy, only needed by the array variants of the converters, is imported by
+# _require_numpy on first use so that importing this module stays cheap
+np = None
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Small integer id of each supported wind speed unit (and its aliases), and
+# the knots per unit of each id, for the compiled kernels
+_UNIT_IDS = {
+    "knots": 0,
+    "kts": 0,
+    "kt": 0,
+    "km/h": 1,
+    "kph": 1,
+    "mph": 2,
+    "m/s": 3,
+}
+_UNIT_FACTORS = (1.0, 0.539957, 0.868976, 1.94384)
+
+# Knots per unit of each supported wind speed unit
+_KNOT_FACTORS = {unit: _UNIT_FACTORS[unit_id] for unit, unit_id in _UNIT_IDS.items()}
+
+# One converter per unit with its factor bound in, for convert_to_knots_for_unit
+_SPECIALIZED = {unit: (lambda factor: lambda value: value * factor)(factor)
+                for unit, factor in _KNOT_FACTORS.items()}
+
+# Wind speed value with an optional unit, and the table turning a decimal
+# comma into a point for float(). The flag is inline so the pattern
+# compiles the same with either engine.
+_WIND_RE = _re_engine.compile(r'(?i)(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)?')
+_COMMA_DOT = str.maketrans({',': '.'})
+
+# Result of parse_wind_data when no wind speed is found, shared by every miss
+_FAIL = (None, None)
+
+# ASCII spellings of the units _WIND_RE matches, mapped to the lower-case
+# unit, so a matched unit is normalized without lower(). The pattern's Unicode
+# case folding also matches a few non-ASCII letters (the Kelvin sign, the long
+# s), which are left to lower().
+_UNIT_NORMALIZE = {
+    "".join(spelling): unit
+    for unit in ("mph", "km/h", "kts", "knots")
+    for spelling in itertools.product(*({c, c.upper()} for c in unit))
+}
+
+# Beaufort scale (knots): upper bound of each force, and the description of
+# every force from 0 (Calm) to 12 (Hurricane force)
+_BEAUFORT_UPPERS = (1, 3, 6, 10, 16, 21, 27, 33, 40, 47, 55, 63)
+_BEAUFORT_DESCS = (
+    "Calm",
+    "Light air",
+    "Light breeze",
+    "Gentle breeze",
+    "Moderate breeze",
+    "Fresh breeze",
+    "Strong breeze",
+    "Near gale",
+    "Gale",
+    "Strong gale",
+    "Storm",
+    "Violent storm",
+    "Hurricane force"
+)
+
+
+def _beaufort_index(speed_knots):
+    """Beaufort number of a wind speed in knots; NaN (unknown) gets 0."""
+    # Values above the last upper bound land on index 12 (Hurricane force)
+    return bisect.bisect_left(_BEAUFORT_UPPERS, speed_knots)
+
+
+def _convert_and_classify(value, unit_id):
+    """Speed in knots and its Beaufort number, for a unit given by its id."""
+    knots = value * _UNIT_FACTORS[unit_id]
+    return knots, _beaufort_index(knots)
+
+
+# Scalar kernel used by convert_and_classify, picked on first use
+_kernel = None
+
+
+def _load_kernel():
+    """
+    Pick the fastest available scalar kernel: the one built ahead of time by
+    build_native.py, then the Numba one, then the pure Python one.
+    
+    Returns:
+        callable: Function taking a value and a unit id and returning
+            (speed in knots, beaufort_number)
+    """
+    global _kernel
+    try:
+        from . import _converters_native as native
+        
+        def kernel(value, unit_id):
+            knots = native.convert_to_knots_f64(value, unit_id)
+            return knots, native.beaufort_index_f64(knots)
+    except ImportError:
+        try:
+            from ._kernels import convert_and_classify as kernel
+        except ImportError:
+            kernel = _convert_and_classify
+    _kernel = kernel
+    return kernel
+
+
+# Batch kernel used by convert_and_classify_batch, None without Numba, looked
+# up once on first use
+_NOT_LOADED = object()
+_batch_kernel = _NOT_LOADED
+
+
+def _load_batch_kernel():
+    """
+    Import the parallel Numba batch kernel, only trying the first time.
+    
+    Returns:
+        callable: The kernel, or None if Numba is not installed
+    """
+    global _batch_kernel
+    if _batch_kernel is _NOT_LOADED:
+        try:
+            from ._kernels import convert_and_classify_batch as _batch_kernel
+        except ImportError:
+            _batch_kernel = None
+    return _batch_kernel
+
 
 def convert_to_knots(value, unit="mph"):
     """
@@ -24,22 +156,142 @@ def convert_to_knots(value, unit="mph"):
     Returns:
         float: The wind speed in knots
     """
-    unit = unit.lower()
-    
-    if unit in ["knots", "kts", "kt"]:
-        return value
-    elif unit in ["km/h", "kph"]:
-        # 1 km/h = 0.539957 knots
-        return value * 0.539957
-    elif unit in ["mph"]:
-        # 1 mph = 0.868976 knots
-        return value * 0.868976
-    elif unit in ["m/s"]:
-        # 1 m/s = 1.94384 knots
-        return value * 1.94384
-    else:
-        logger.warning(f"Unknown wind speed unit: {unit}, assuming knots")
+    # Units usually arrive lowercased already (parse_wind_data does it)
+    factor = _KNOT_FACTORS.get(unit)
+    if factor is None:
+        factor = _KNOT_FACTORS.get(unit.lower())
+    if factor is None:
+        logger.warning("Unknown wind speed unit: %s, assuming knots", unit.lower())
         return value
+    return value * factor
+
+
+def convert_and_classify(value, unit="mph"):
+    """
+    Convert a wind speed to knots and get its Beaufort number in one call.
+    
+    Args:
+        value (float): The wind speed value
+        unit (str): The unit of the wind speed (knots, km/h, mph, m/s)
+        
+    Returns:
+        tuple: (speed in knots, beaufort_number)
+    """
+    unit_id = _UNIT_IDS.get(unit)
+    if unit_id is None:
+        unit_id = _UNIT_IDS.get(unit.lower())
+    if unit_id is None:
+        logger.warning("Unknown wind speed unit: %s, assuming knots", unit.lower())
+        unit_id = 0
+    return (_kernel or _load_kernel())(float(value), unit_id)
+
+
+def convert_and_classify_batch(values, unit="mph"):
+    """
+    Convert many wind speeds in the same unit to knots and get their
+    Beaufort numbers.
+    
+    With Numba installed the work is split across all CPU cores; otherwise
+    it runs as NumPy array operations.
+    
+    Args:
+        values (array-like): The wind speed values
+        unit (str): The unit of the wind speeds (knots, km/h, mph, m/s)
+        
+    Returns:
+        tuple: (array of speeds in knots, array of beaufort numbers)
+    """
+    _require_numpy()
+    unit_id = _UNIT_IDS.get(unit)
+    if unit_id is None:
+        unit_id = _UNIT_IDS.get(unit.lower())
+    if unit_id is None:
+        logger.warning("Unknown wind speed unit: %s, assuming knots", unit.lower())
+        unit_id = 0
+    values = np.ascontiguousarray(values, dtype=float).ravel()
+    
+    batch_kernel = _load_batch_kernel()
+    if batch_kernel is None:
+        knots = values * _UNIT_FACTORS[unit_id]
+        numbers = np.searchsorted(_BEAUFORT_UPPERS_NP, knots, side='left')
+        # NaN (unknown) gets 0, as in _beaufort_index
+        return knots, np.where(np.isnan(knots), 0, numbers)
+    
+    knots = np.empty_like(values)
+    numbers = np.empty(values.shape, dtype=np.intp)
+    batch_kernel(values, unit_id, knots, numbers)
+    return knots, numbers
+
+
+def convert_to_knots_for_unit(unit):
+    """
+    Get a function converting wind speeds in one unit to knots.
+    
+    Binding the unit once spares loops over many values the unit lookup
+    convert_to_knots does on every call.
+    
+    Args:
+        unit (str): The unit of the wind speeds (knots, km/h, mph, m/s)
+        
+    Returns:
+        callable: Function taking a wind speed value and returning it in knots
+    """
+    converter = _SPECIALIZED.get(unit)
+    if converter is None:
+        converter = _SPECIALIZED.get(unit.lower())
+    if converter is None:
+        logger.warning("Unknown wind speed unit: %s, assuming knots", unit.lower())
+        return lambda value: value
+    return converter
+
+
+def convert_to_knots_array(values, unit="mph", out=None):
+    """
+    Convert many wind speeds in the same unit to knots at once.
+    
+    Args:
+        values (array-like): The wind speed values
+        unit (str): The unit of the wind speeds (knots, km/h, mph, m/s)
+        out (numpy.ndarray, optional): Float array to write the result to, which
+            may be values itself to avoid allocating a new array
+        
+    Returns:
+        numpy.ndarray: The wind speeds in knots
+    """
+    _require_numpy()
+    factor = _KNOT_FACTORS.get(unit.lower())
+    if factor is None:
+        logger.warning("Unknown wind speed unit: %s, assuming knots", unit.lower())
+        factor = 1.0
+    return np.multiply(np.asarray(values, dtype=float), factor, out=out)
+
+
+def _require_numpy():
+    """
+    Import NumPy for the array converters, on first use.
+    
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    global np, _BEAUFORT_UPPERS_NP, _BEAUFORT_DESCS_NP, _BEAUFORT_UPPERS_U8
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for the array converters") from None
+    
+    # The Beaufort table as arrays, with an extra "Unknown" description for
+    # missing (NaN) speeds
+    _BEAUFORT_UPPERS_NP = numpy.array(_BEAUFORT_UPPERS, dtype=float)
+    _BEAUFORT_DESCS_NP = numpy.array(_BEAUFORT_DESCS + ("Unknown",), dtype=object)
+    _BEAUFORT_UPPERS_U8 = numpy.array(_BEAUFORT_UPPERS, dtype=numpy.uint8)
+    np = numpy
+
+
+def _normalize_unit(unit):
+    """Lower-case a unit matched by _WIND_RE."""
+    return _UNIT_NORMALIZE.get(unit) or unit.lower()
 
 
 def parse_wind_data(wind_text):
@@ -53,19 +305,46 @@ def parse_wind_data(wind_text):
         tuple: (value in float, unit as string) or (None, None) if parsing fails
     """
     if not wind_text:
-        return None, None
+        return _FAIL
         
     # Extract numeric value and unit
-    match = re.search(r'(\d+(?:[,.]\d+)?)\s*(mph|km/h|kts|knots)?', wind_text, re.IGNORECASE)
+    match = _WIND_RE.search(wind_text)
     if match:
         # Replace comma with period for proper float conversion
-        value_str = match.group(1).replace(',', '.')
+        value_str = match.group(1).translate(_COMMA_DOT)
         value = float(value_str)
-        unit = match.group(2).lower() if match.group(2) else "mph"  # Default to mph if no unit specified
+        unit = _normalize_unit(match.group(2)) if match.group(2) else "mph"  # Default to mph if no unit specified
         return value, unit
     else:
-        logger.warning(f"Could not extract numeric wind speed from: {wind_text}")
-        return None, None
+        logger.warning("Could not extract numeric wind speed from: %s", wind_text)
+        return _FAIL
+
+
+def parse_and_classify_fast(wind_text):
+    """
+    Parse wind data from text, convert it to knots and classify it, all at once.
+    
+    Unlike parse_wind_data, text without a number is not logged, so this
+    suits bulk processing where misses are expected.
+    
+    Args:
+        wind_text (str): Text containing wind speed information
+        
+    Returns:
+        tuple: (value, unit, speed in knots, beaufort_number, description), or
+               None if no wind speed is found
+    """
+    if not wind_text:
+        return None
+    match = _WIND_RE.search(wind_text)
+    if not match:
+        return None
+    
+    value = float(match.group(1).translate(_COMMA_DOT))
+    unit = _normalize_unit(match.group(2)) if match.group(2) else "mph"  # Default to mph if no unit specified
+    knots = value * _KNOT_FACTORS.get(unit, 1.0)
+    i = bisect.bisect_left(_BEAUFORT_UPPERS, knots)
+    return value, unit, knots, i, _BEAUFORT_DESCS[i]
 
 
 def format_wind_speed(speed, unit="knots", precision=1):
@@ -82,9 +361,44 @@ def format_wind_speed(speed, unit="knots", precision=1):
     """
     if speed is None:
         return "N/A"
+    
+    # Percent formatting has the least overhead for this; one decimal is the
+    # common case and skips the variable precision
+    if precision == 1:
+        return "%.1f %s" % (speed, unit)
+    return "%.*f %s" % (precision, speed, unit)
+
+
+def get_beaufort_index(speed_knots):
+    """
+    Get the Beaufort number of a wind speed, without its description.
+    
+    Args:
+        speed_knots (float): Wind speed in knots
         
-    format_str = f"{{:.{precision}f}} {unit}"
-    return format_str.format(speed)
+    Returns:
+        int: Beaufort number from 0 to 12, or 0 if the speed is None or NaN
+    """
+    if speed_knots is None:
+        return 0
+    
+    # A single bisect beats calling into compiled code from Python, so the
+    # Numba version of the lookup is only used inside the kernels.
+    # Values above the last upper bound land on index 12 (Hurricane force)
+    return bisect.bisect_left(_BEAUFORT_UPPERS, speed_knots)
+
+
+def get_beaufort_description(beaufort_number):
+    """
+    Get the description of a Beaufort number.
+    
+    Args:
+        beaufort_number (int): Beaufort number from 0 to 12
+        
+    Returns:
+        str: Description of the wind force
+    """
+    return _BEAUFORT_DESCS[beaufort_number]
 
 
 def get_wind_description(speed_knots):
@@ -95,30 +409,58 @@ def get_wind_description(speed_knots):
         speed_knots (float): Wind speed in knots
         
     Returns:
-        tuple: (beaufort_number, description)
-    """
-    # Beaufort scale (knots)
-    beaufort_scale = [
-        (0, 1, "Calm"),
-        (1, 3, "Light air"),
-        (4, 6, "Light breeze"),
-        (7, 10, "Gentle breeze"),
-        (11, 16, "Moderate breeze"),
-        (17, 21, "Fresh breeze"),
-        (22, 27, "Strong breeze"),
-        (28, 33, "Near gale"),
-        (34, 40, "Gale"),
-        (41, 47, "Strong gale"),
-        (48, 55, "Storm"),
-        (56, 63, "Violent storm"),
-        (64, float('inf'), "Hurricane force")
-    ]
-    
-    if speed_knots is None:
+        tuple: (beaufort_number, description); an unknown (None or NaN)
+               speed gets number 0 and description "Unknown"
+    """
+    # NaN is the only value not equal to itself
+    if speed_knots is None or speed_knots != speed_knots:
         return 0, "Unknown"
+    
+    i = get_beaufort_index(speed_knots)
+    return i, _BEAUFORT_DESCS[i]
+
+
+def get_wind_description_array(speeds_knots):
+    """
+    Get Beaufort numbers and descriptions for many wind speeds at once.
+    
+    Args:
+        speeds_knots (array-like): Wind speeds in knots, NaN where unknown, or
+            the uint8 output of quantize_wind_speeds
+        
+    Returns:
+        tuple: (array of beaufort numbers, array of descriptions); unknown
+               speeds get number 0 and description "Unknown", as in
+               get_wind_description
+    """
+    _require_numpy()
+    speeds = np.asarray(speeds_knots)
+    if speeds.dtype == np.uint8:
+        # Quantized speeds are never NaN and are compared a byte at a time
+        numbers = np.searchsorted(_BEAUFORT_UPPERS_U8, speeds, side='left')
+        return numbers, _BEAUFORT_DESCS_NP[numbers]
+    
+    speeds = speeds.astype(float, copy=False)
+    numbers = np.searchsorted(_BEAUFORT_UPPERS_NP, speeds, side='left')
+    unknown = np.isnan(speeds)
+    descriptions = _BEAUFORT_DESCS_NP[np.where(unknown, len(_BEAUFORT_DESCS), numbers)]
+    return np.where(unknown, 0, numbers), descriptions
+
+
+def quantize_wind_speeds(speeds_knots):
+    """
+    Pack wind speeds into a uint8 array for compact Beaufort classification.
+    
+    Speeds are rounded up, which keeps every Beaufort number unchanged since
+    the scale's bounds are whole knots. A quarter of the memory of float32
+    makes large arrays of stored speeds faster to classify.
+    
+    Args:
+        speeds_knots (array-like): Wind speeds in knots
         
-    for i, (lower, upper, description) in enumerate(beaufort_scale):
-        if lower <= speed_knots <= upper:
-            return i, description
-            
-    return 12, "Hurricane force"  # Default for very high values 
\ No newline at end of file
+    Returns:
+        numpy.ndarray: Speeds as uint8, clipped to 0-255; NaN becomes 0
+    """
+    _require_numpy()
+    speeds = np.nan_to_num(np.asarray(speeds_knots, dtype=float), nan=0.0)
+    return np.clip(np.ceil(speeds), 0, 255).astype(np.uint8)